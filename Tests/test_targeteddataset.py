@@ -459,6 +459,27 @@ class test_targeteddataset_synthetic(unittest.TestCase):
 				assert issubclass(w[1].category, UserWarning)
 				assert "Does not have sample metadata information:" in str(w[1].message)
 
+		with self.subTest(msg='check multiple failures raised as a single warning'):
+			badDataset = copy.deepcopy(self.targetedData3)
+			badDataset.sampleMetadata.drop(['Subject ID'], axis=1, inplace=True)
+			badDataset.sampleMetadata['Sample ID'] = 1
+			with warnings.catch_warnings(record=True) as w:
+				# Cause all warnings to always be triggered.
+				warnings.simplefilter("always")
+				# warning
+				result = badDataset.validateObject(verbose=False, raiseError=False, raiseWarning=True)
+				# check it generally worked
+				self.assertEqual(result, {'Dataset': True, 'BasicTargetedDataset': True, 'QC': True, 'sampleMetadata': False})
+				# check each warning, failures are listed in check order in one warning
+				self.assertEqual(len(w), 2)
+				assert issubclass(w[0].category, UserWarning)
+				failures = str(w[0].message).split('\n')
+				self.assertEqual(len(failures), 2)
+				assert "Failure, 'self.sampleMetadata' lacks a 'Subject ID' column" in failures[0]
+				assert "Failure, 'self.sampleMetadata['Sample ID']' is <class 'numpy.int64'>" in failures[1]
+				assert issubclass(w[1].category, UserWarning)
+				assert "Does not have sample metadata information: 2 errors found" in str(w[1].message).replace('\t', '')
+
 		with self.subTest(msg='self.Attributes[\'methodName\'] does not exist'):
 			badDataset = copy.deepcopy(self.targetedData3)
 			del badDataset.Attributes['methodName']
@@ -1142,6 +1163,70 @@ class test_targeteddataset_synthetic(unittest.TestCase):
 				pandas.testing.assert_frame_equal(expectedDataset.calibration[i]['calibExpectedConcentration'], concatenatedDataset.calibration[i]['calibExpectedConcentration'])
 
 
+	@unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
+	def test_targeteddataset_add_reorderedfeatures(self, mock_stdout):
+
+		def makeDataset(featureNames, intensityData, sampleNames, featureMask):
+			dataset = copy.deepcopy(self.targetedData3)
+			featureMetadata = pandas.concat([self.targetedData3.featureMetadata] * len(featureNames), ignore_index=True)
+			featureMetadata['Feature Name'] = featureNames
+			featureMetadata['extID1'] = featureNames
+			featureMetadata['extID2'] = featureNames
+			dataset.featureMetadata = featureMetadata
+			dataset.sampleMetadata = pandas.concat([self.targetedData3.sampleMetadata] * len(sampleNames), ignore_index=True)
+			dataset.sampleMetadata['Sample File Name'] = sampleNames
+			dataset._intensityData = numpy.array(intensityData, dtype=float)
+			dataset.expectedConcentration = pandas.DataFrame(numpy.full(dataset._intensityData.shape, numpy.nan), columns=featureNames)
+			dataset.calibration['calibFeatureMetadata'] = featureMetadata
+			dataset.calibration['calibIntensityData'] = numpy.ones((1, len(featureNames)))
+			dataset.calibration['calibExpectedConcentration'] = pandas.DataFrame(numpy.ones((1, len(featureNames))), columns=featureNames)
+			dataset.initialiseMasks()
+			dataset.featureMask = numpy.array(featureMask)
+			return dataset
+
+		# features partially overlap and are not in the same order
+		firstDataset = makeDataset(['Feature1', 'Feature2', 'Feature3'], [[1., 2., 3.], [4., 5., 6.]], ['Unittest_targeted_file_101', 'Unittest_targeted_file_102'], [False, False, True])
+		secondDataset = makeDataset(['Feature3', 'Feature1', 'Feature4'], [[7., 8., 9.]], ['Unittest_targeted_file_103'], [True, False, True])
+
+		with warnings.catch_warnings():
+			warnings.simplefilter('ignore', UserWarning)
+			concatenatedDataset = firstDataset + secondDataset
+
+		with self.subTest(msg='Checking merged features'):
+			self.assertEqual(concatenatedDataset.featureMetadata['Feature Name'].tolist(), ['Feature1', 'Feature2', 'Feature3', 'Feature4'])
+		with self.subTest(msg='Checking intensityData is reprojected on the merged features'):
+			expectedIntensityData = numpy.array([[1., 2., 3., numpy.nan], [4., 5., 6., numpy.nan], [8., numpy.nan, 7., 9.]])
+			numpy.testing.assert_array_equal(concatenatedDataset._intensityData, expectedIntensityData)
+		with self.subTest(msg='Checking featureMask'):
+			# Feature1 False in both, Feature2 only in first, Feature3 disagree (default True), Feature4 only in second
+			numpy.testing.assert_array_equal(concatenatedDataset.featureMask, numpy.array([False, False, True, True]))
+		with self.subTest(msg='Checking inputs are not modified'):
+			numpy.testing.assert_array_equal(firstDataset._intensityData, numpy.array([[1., 2., 3.], [4., 5., 6.]]))
+			numpy.testing.assert_array_equal(secondDataset._intensityData, numpy.array([[7., 8., 9.]]))
+			self.assertEqual(secondDataset.featureMetadata['Feature Name'].tolist(), ['Feature3', 'Feature1', 'Feature4'])
+
+
+	@unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
+	def test_targeteddataset_add_samefeatures(self, mock_stdout):
+
+		otherDataset = copy.deepcopy(self.targetedData3)
+		otherDataset.sampleMetadata['Sample File Name'] = ['Unittest_targeted_file_108']
+		otherDataset._intensityData = numpy.array([[60]])
+
+		with warnings.catch_warnings():
+			warnings.simplefilter('ignore', UserWarning)
+			concatenatedDataset = self.targetedData3 + otherDataset
+
+		with self.subTest(msg='Checking samples are stacked'):
+			numpy.testing.assert_array_equal(concatenatedDataset._intensityData, numpy.array([[50.], [60.]]))
+		with self.subTest(msg='Checking intensityData is float and does not share memory with the inputs'):
+			self.assertEqual(concatenatedDataset._intensityData.dtype, numpy.float64)
+			self.assertFalse(numpy.shares_memory(concatenatedDataset._intensityData, self.targetedData3._intensityData))
+			self.assertFalse(numpy.shares_memory(concatenatedDataset._intensityData, otherDataset._intensityData))
+		with self.subTest(msg='Checking featureMask'):
+			numpy.testing.assert_array_equal(concatenatedDataset.featureMask, numpy.array([True]))
+
+
 	def test_targeteddataset_applymasks(self):
 		# remove feature3
 		expectedDataset = copy.deepcopy(self.expectedAddDataset)
@@ -3427,6 +3512,20 @@ class test_targeteddataset_mergelimitsofquantification(unittest.TestCase):
 			self.assertEqual(result.calibration, expected.calibration)
 
 
+	@unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
+	def test_mergelimitsofquantification_log(self, mock_stdout):
+		# Validation of the input and of the merged LOQ must not be logged in the dataset
+		result = copy.deepcopy(self.targetedDataset)
+		logLength = len(result.Attributes['Log'])
+		result.mergeLimitsOfQuantification(onlyLLOQ=False, keepBatchLOQ=False)
+
+		newLog = [entry[1] for entry in result.Attributes['Log'][logLength:]]
+		self.assertEqual(len(newLog), 3)
+		self.assertEqual(newLog[0], 'Masks Initialised to True.\n')
+		self.assertTrue(newLog[1].startswith('Limits of quantification applied to LLOQ and ULOQ'))
+		self.assertEqual(newLog[2], 'LOQ merged (keepBatchLOQ =  False, onlyLLOQ = False).')
+
+
 	@unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
 	def test_mergelimitsofquantification_raise(self, mock_stdout):
 
@@ -5148,6 +5247,46 @@ class test_targeteddataset_full_brukerxml_load(unittest.TestCase):
 					self.assertEqual(expected['Attributes'][i], result.Attributes[i])
 
 
+	@unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
+	def test_loadBrukerXMLDataset_keepFirstDuplicate(self, mock_stdout):
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			for expno, date, value in [(10, '2017-08-23T20:56:55', 4.3), (20, '2017-08-23T20:36:12', 0.19)]:
+				pdataPath = os.path.join(tmpdirname, 'UnitTest_Rack1', str(expno), 'pdata', '1')
+				os.makedirs(pdataPath)
+				with open(os.path.join(pdataPath, 'UnitTest_expno%i.xml' % (expno)), 'w') as tmpf:
+					tmpf.write('<QUANTIFICATION_REPORT><SAMPLE name="UnitTest_expno%i.10" date="%s"/><QUANTIFICATION>'
+							   '<PARAMETER name="Alanine" type="quantification"><VALUE value="%s" unit="mmol/L" lod="0.1" loq="-"/></PARAMETER>'
+							   '<PARAMETER name="Glycine" type="quantification"><VALUE value="2" unit="mmol/L" lod="0.1" loq="-"/></PARAMETER>'
+							   '<PARAMETER name="Glycine" type="quantification"><VALUE value="3" unit="mmol/L" lod="0.1" loq="-"/></PARAMETER>'
+							   '<PARAMETER name="Alanine" type="quantification"><VALUE value="%s" unit="mmol/mol Crea" lod="0.1" loq="-"/></PARAMETER>'
+							   '</QUANTIFICATION></QUANTIFICATION_REPORT>' % (expno, date, value, value * 10))
+
+			with self.subTest(msg='Only the first occurence of duplicated features is kept'):
+				with self.assertWarnsRegex(UserWarning, r'The following features are present more than once, only the first occurence will be kept: \[\'Alanine\', \'Glycine\'\]'):
+					result = nPYc.TargetedDataset(tmpdirname, fileType='Bruker Quantification', sop='BrukerQuant-UR', fileNamePattern='.*?\.xml$')
+
+				result.sampleMetadata.sort_values('Sample File Name', inplace=True)
+				intensityData = result.intensityData[result.sampleMetadata.index.values, :]
+
+				self.assertEqual(result.featureMetadata['Feature Name'].tolist(), ['Alanine', 'Glycine'])
+				self.assertEqual(result.featureMetadata['Unit'].tolist(), ['mmol/L', 'mmol/L'])
+				numpy.testing.assert_array_almost_equal(intensityData, numpy.array([[4.3, 2.], [0.19, 2.]]))
+
+			with self.subTest(msg='Duplicates are only searched in the unit kept'):
+				with warnings.catch_warnings(record=True) as w:
+					warnings.simplefilter('always')
+					result = nPYc.TargetedDataset(tmpdirname, fileType='Bruker Quantification', sop='BrukerQuant-UR', fileNamePattern='.*?\.xml$', unit='mmol/mol Crea')
+				self.assertFalse(any('present more than once' in str(warning.message) for warning in w))
+
+				result.sampleMetadata.sort_values('Sample File Name', inplace=True)
+				intensityData = result.intensityData[result.sampleMetadata.index.values, :]
+
+				self.assertEqual(result.featureMetadata['Feature Name'].tolist(), ['Alanine'])
+				self.assertEqual(result.featureMetadata['Unit'].tolist(), ['mmol/mol Crea'])
+				numpy.testing.assert_array_almost_equal(intensityData, numpy.array([[43.], [1.9]]))
+
+
 	def test_brukerXML_raises(self):
 
 		with self.subTest(msg='Raises TypeError if `fileNamePattern` is not a str'):
@@ -5295,6 +5434,23 @@ class test_targeteddataset_exportdataset(unittest.TestCase):
 			pandas.testing.assert_frame_equal(expectedCombined.reindex(sorted(expectedCombined), axis=1), exportedCombined.reindex(sorted(exportedCombined), axis=1), check_dtype=False)
 
 
+	def test_exportdataset_exportunifiedcsv_chunks(self):
+		# Samples written by blocks give the same file as a single write
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			self.targeted._exportUnifiedCSV(os.path.join(tmpdirname, 'single'))
+			with unittest.mock.patch('nPYc.objects._targetedDataset._exportChunkSize', 4):
+				self.targeted._exportUnifiedCSV(os.path.join(tmpdirname, 'chunked'))
+
+			with open(os.path.join(tmpdirname, 'single_combinedData.csv'), 'rb') as f:
+				expected = f.read()
+			with open(os.path.join(tmpdirname, 'chunked_combinedData.csv'), 'rb') as f:
+				obtained = f.read()
+
+		self.assertEqual(obtained, expected)
+		# integer sample metadata columns are written as float, as they are empty on the feature metadata rows
+		self.assertIn(b'UnitTest_targeted_file_009,9.0,9.0,', obtained)
+
+
 	def test_exportdataset_raise_warning(self):
 		normalisationWarning = copy.deepcopy(self.targeted)
 		normalisationWarning.intensityData[0, :] = [50., 50., 50., 50., 50., 50., 50.]
@@ -5308,6 +5464,24 @@ class test_targeteddataset_exportdataset(unittest.TestCase):
 				# warning
 				self.targeted.exportDataset(destinationPath=targetFolder, saveFormat='CSV')
 
+	def test_exportdataset_input_unchanged(self):
+		# Dilution scaling and the export Log are applied to a copy, not to the dataset exported
+		self.targeted.sampleMetadata['Dilution'] = [50, 100, 100, 100, 100, 100]
+		expectedIntensityData = copy.deepcopy(self.targeted._intensityData)
+		expectedLog = copy.deepcopy(self.targeted.Attributes['Log'])
+		expectedSaveDir = getattr(self.targeted, 'saveDir', None)
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			self.targeted.exportDataset(destinationPath=tmpdirname, saveFormat='CSV')
+			exportedIntensityData = pandas.read_csv(os.path.join(tmpdirname, self.targeted.name + '_intensityData.csv'), index_col=False, header=None)
+
+		numpy.testing.assert_array_equal(self.targeted._intensityData, expectedIntensityData)
+		self.assertEqual(self.targeted.Attributes['Log'], expectedLog)
+		self.assertEqual(getattr(self.targeted, 'saveDir', None), expectedSaveDir)
+		# first sample is scaled in the export only
+		self.assertEqual(exportedIntensityData.iloc[0, 6], 100.)
+
+
 	def test_exportdataset_ISATAB_raise_notimplemented(self):
 		with tempfile.TemporaryDirectory() as tmpdirname:
 			self.assertRaises(NotImplementedError, self.targeted.exportDataset, destinationPath=tmpdirname, saveFormat='ISATAB')
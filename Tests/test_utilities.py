@@ -689,6 +689,44 @@ class test_utilities_read_bruker_xml(unittest.TestCase):
 			self.assertWarnsRegex(UserWarning, 'Error parsing xml in .+?, skipping', importBrukerXML, [tmpfile])
 
 
+	def test_utilities_importBrukerXML_parallelise(self):
+
+		from nPYc.utilities._readBrukerXML import importBrukerXML
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			filelist = list()
+			for expno, date, value in [(10, '2017-08-23T20:56:55', 4.3), (20, '2017-08-23T20:36:12', 0.19), (30, '2017-08-23T21:12:40', 43.)]:
+				tmpfile = os.path.join(tmpdirname, 'UnitTest_expno%i.xml' % (expno))
+				with open(tmpfile, 'w') as tmpf:
+					tmpf.write('<QUANTIFICATION_REPORT><SAMPLE name="UnitTest_expno%i.10" date="%s"/><QUANTIFICATION>'
+							   '<PARAMETER name="Creatinine" type="quantification"><VALUE value="%s" unit="mmol/L" lod="0.1" loq="-"/></PARAMETER>'
+							   '<PARAMETER name="Alanine" type="quantification"><VALUE value="1" unit="mmol/L" lod="0.1" loq="-"/></PARAMETER>'
+							   '</QUANTIFICATION></QUANTIFICATION_REPORT>' % (expno, date, value))
+				filelist.append(tmpfile)
+
+			tmpfile = os.path.join(tmpdirname, 'malformedxml.xml')
+			with open(tmpfile, 'w') as tmpf:
+				tmpf.write('Most definitely not xml <as \n')
+			filelist.insert(1, tmpfile)
+
+			with self.subTest(msg='Parse error still warned'):
+				with self.assertWarnsRegex(UserWarning, 'Error parsing xml in .+?malformedxml.xml, skipping'):
+					obtained = importBrukerXML(filelist, parallelise=True)
+
+			with warnings.catch_warnings():
+				warnings.simplefilter('ignore')
+				expected = importBrukerXML(filelist, parallelise=False)
+
+			with self.subTest(msg='Same matrices as serial import'):
+				numpy.testing.assert_array_equal(obtained[0], expected[0])
+				pandas.testing.assert_frame_equal(obtained[1], expected[1])
+				pandas.testing.assert_frame_equal(obtained[2], expected[2])
+				self.assertEqual(obtained[0].shape, (3, 2))
+
+			with self.subTest(msg='parallelise must be a bool'):
+				self.assertRaises(TypeError, importBrukerXML, filelist, parallelise=1)
+
+
 	def test_utilities_importBrukerXML(self):
 
 		from nPYc.utilities._readBrukerXML import importBrukerXML
@@ -11,6 +11,7 @@ from pandas.util.testing import assert_frame_equal
 import os
 import tempfile
 import inspect
+import warnings
 
 sys.path.append("..")
 import nPYc
@@ -130,6 +131,46 @@ class test_utilities_extractParams(unittest.TestCase):
 			self.assertEqual(obtained, expected)
 
 
+	def test_extractParams_scanBrukerFiles(self):
+
+		import re
+		from nPYc.utilities.extractParams import _scanBrukerFiles
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			for expno in ['10', '11']:
+				for pdata in ['1', '2']:
+					os.makedirs(os.path.join(tmpdirname, 'UnitTest_Rack1', expno, 'pdata', pdata))
+					for fileName in ['plasma_quant_report.xml', 'other_report.xml']:
+						with open(os.path.join(tmpdirname, 'UnitTest_Rack1', expno, 'pdata', pdata, fileName), 'w') as f:
+							f.write('')
+			# A folder matching the pattern is returned, not descended into
+			os.makedirs(os.path.join(tmpdirname, 'UnitTest_Rack1', '12', 'pdata', '1', 'plasma_quant_report.xml'))
+			expected = [os.path.join(tmpdirname, 'UnitTest_Rack1', expno, 'pdata', '1', 'plasma_quant_report.xml') for expno in ['10', '11', '12']]
+
+			with self.subTest(msg='pattern and pdata filtering'):
+				obtained = list(_scanBrukerFiles(tmpdirname, re.compile('.*?plasma_quant_report\.xml$'), re.compile('pdata.*?1')))
+				obtained.sort()
+
+				self.assertEqual(obtained, expected)
+
+			with self.subTest(msg='same files as buildFileList'):
+				from nPYc.utilities.extractParams import buildFileList
+
+				expectedFileList = buildFileList(tmpdirname, re.compile('.*?_report\.xml$'))
+				obtained = list(_scanBrukerFiles(tmpdirname, re.compile('.*?_report\.xml$'), re.compile('pdata')))
+
+				self.assertEqual(sorted(obtained), sorted(expectedFileList))
+
+			if hasattr(os, 'symlink'):
+				with self.subTest(msg='symbolic link to a parent folder'):
+					os.symlink(tmpdirname, os.path.join(tmpdirname, 'UnitTest_Rack1', '10', 'loop'), target_is_directory=True)
+
+					obtained = list(_scanBrukerFiles(tmpdirname, re.compile('.*?plasma_quant_report\.xml$'), re.compile('pdata.*?1')))
+					obtained.sort()
+
+					self.assertEqual(obtained, expected)
+
+
 	def test_extractParams_extractWatersRAWParams(self):
 		from nPYc.utilities.extractParams import extractWatersRAWParams
 
@@ -308,3 +349,196 @@ class test_utilities_extractParams(unittest.TestCase):
 				obtained = extractBrukerparams(filePath, queryItems, acqTimeRE)
 
 			self.assertEqual(obtained['Warnings'][:15], 'Unable to open ')
+
+
+	def writeWatersRaw(self, folder, name):
+		"""
+		Write a minimal Waters .raw folder, with a few of the parameters read by extractParams.
+		"""
+		rawPath = os.path.join(folder, name + '.raw')
+		os.makedirs(rawPath)
+		with open(os.path.join(rawPath, '_extern.inf'), 'w', newline='') as f:
+			f.write('Resolution\t\t\t13000\r\nCapillary (kV)\t\t\t1.0000\r\nSampling Cone\t\t\t20.0000\r\n')
+		with open(os.path.join(rawPath, '_HEADER.TXT'), 'w', newline='') as f:
+			f.write('$$ Acquired Date: 27-Nov-2014\r\n$$ Acquired Time: 13:29:48\r\n$$ Instrument: XEVO-G2SQTOF#YDA121\r\n')
+		with open(os.path.join(rawPath, '_INLET.INF'), 'w', newline='') as f:
+			f.write('ColumnType: ACQUITY UPLC HSS T3\r\nColumn Serial Number: 01573413615729\r\n')
+
+		return rawPath
+
+
+	def test_extractParams_parallelise(self):
+		from nPYc.utilities.extractParams import extractParams
+		from nPYc.utilities._getMetadataFromWatersRaw import getSampleMetadataFromWatersRawFiles
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			for i in range(5):
+				self.writeWatersRaw(tmpdirname, 'UnitTest_Sample%i' % (i))
+
+			with warnings.catch_warnings():
+				warnings.simplefilter('ignore')
+				expected = extractParams(tmpdirname, 'Waters .raw', parallelise=False)
+				obtained = extractParams(tmpdirname, 'Waters .raw', parallelise=True)
+				expectedMetadata = getSampleMetadataFromWatersRawFiles(tmpdirname, parallelise=False)
+				obtainedMetadata = getSampleMetadataFromWatersRawFiles(tmpdirname, parallelise=True)
+
+		with self.subTest(msg='extractParams'):
+			self.assertEqual(expected.shape[0], 5)
+			assert_frame_equal(obtained, expected)
+
+		with self.subTest(msg='getSampleMetadataFromWatersRawFiles'):
+			assert_frame_equal(obtainedMetadata, expectedMetadata)
+
+
+	def test_getSampleMetadataFromWatersRawFiles_acquiredTime(self):
+		from datetime import datetime
+		from nPYc.utilities._getMetadataFromWatersRaw import getSampleMetadataFromWatersRawFiles
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			self.writeWatersRaw(tmpdirname, 'UnitTest_Sample1')
+			rawPath = self.writeWatersRaw(tmpdirname, 'UnitTest_Sample2')
+			with open(os.path.join(rawPath, '_HEADER.TXT'), 'w', newline='') as f:
+				f.write('$$ Acquired Date: 27/11/2014\r\n$$ Acquired Time: 13:29:48\r\n$$ Instrument: XEVO-G2SQTOF#YDA121\r\n')
+
+			with warnings.catch_warnings():
+				warnings.simplefilter('ignore')
+				obtained = getSampleMetadataFromWatersRawFiles(tmpdirname)
+
+		acquiredTime = obtained.set_index('Sample File Name')['Acquired Time']
+		self.assertEqual(acquiredTime.dtype, object)
+		self.assertIsInstance(acquiredTime['UnitTest_Sample1'], datetime)
+		self.assertEqual(acquiredTime['UnitTest_Sample1'], datetime(2014, 11, 27, 13, 29, 48))
+		# Unparsable date
+		self.assertTrue(pandas.isnull(acquiredTime['UnitTest_Sample2']))
+
+
+	def test_getSampleMetadataFromWatersRawFiles_duplicates(self):
+		from nPYc.utilities._getMetadataFromWatersRaw import getSampleMetadataFromWatersRawFiles
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			for batch in ['batch1', 'batch2', 'batch3']:
+				os.makedirs(os.path.join(tmpdirname, batch))
+				self.writeWatersRaw(os.path.join(tmpdirname, batch), 'UnitTest_Sample1')
+			self.writeWatersRaw(os.path.join(tmpdirname, 'batch1'), 'UnitTest_Sample2')
+			self.writeWatersRaw(os.path.join(tmpdirname, 'batch2'), 'UnitTest_Sample2')
+			self.writeWatersRaw(os.path.join(tmpdirname, 'batch1'), 'UnitTest_Sample3')
+
+			with warnings.catch_warnings(record=True) as w:
+				warnings.simplefilter('always')
+				obtained = getSampleMetadataFromWatersRawFiles(tmpdirname)
+
+		messages = [str(warning.message) for warning in w if str(warning.message).startswith('Duplicate raw data')]
+		self.assertEqual(sorted(obtained['Sample File Name']), ['UnitTest_Sample1', 'UnitTest_Sample2', 'UnitTest_Sample3'])
+		self.assertEqual(len(messages), 1)
+		self.assertTrue(messages[0].startswith('Duplicate raw data loaded, discarding 3 duplicates of: '))
+		self.assertIn('UnitTest_Sample1', messages[0])
+		self.assertIn('UnitTest_Sample2', messages[0])
+		self.assertNotIn('UnitTest_Sample3', messages[0])
+
+
+	def test_extractParams_parallelise_raises(self):
+		from nPYc.utilities.extractParams import extractParams
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			self.assertRaises(TypeError, extractParams, tmpdirname, 'Waters .raw', parallelise='True')
+
+
+	def test_extractParams_missingParameters(self):
+		import re
+		from nPYc.utilities.extractParams import _extractWatersRAWParams, _extractBrukerparams
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			with self.subTest(msg='Waters'):
+				filePath = self.writeWatersRaw(tmpdirname, 'UnitTest_Sample')
+				queryItems = dict()
+				queryItems['_extern.inf'] = ['Resolution', 'Unknown param']
+				queryItems['unknown.file'] = ['Capillary (kV)', 'Sampling Cone']
+
+				with warnings.catch_warnings(record=True) as w:
+					warnings.simplefilter('always')
+					obtained, missingParameters = _extractWatersRAWParams(filePath, queryItems, raiseWarning=False)
+
+				self.assertEqual(len(w), 0)
+				self.assertEqual(obtained['Resolution'], '13000')
+				self.assertEqual(obtained['Warnings'], 'Parameter Unknown param not found.; Unable to open ' + os.path.join(filePath, 'unknown.file') + ' for reading.')
+				self.assertEqual(missingParameters, ['Unknown param', 'Capillary (kV)', 'Sampling Cone'])
+
+			with self.subTest(msg='Bruker'):
+				pathHeader = os.path.join(tmpdirname, 'UnitTest_Rack1', '10')
+				os.makedirs(os.path.join(pathHeader, 'pdata', '1'))
+				with open(os.path.join(pathHeader, 'acqus'), 'w') as f:
+					f.write('##$RG= 84.66\n##$SW= 20.0122783578804\n##END=\n')
+				filePath = os.path.join(pathHeader, 'pdata', '1', '1r')
+				queryItems = dict()
+				queryItems[os.path.join('..', '..', 'acqus')] = ['##$RG=', '##$UNKNOWNPARAM=']
+				queryItems['MISSINGFILE'] = ['##$OFFSET=']
+
+				with warnings.catch_warnings(record=True) as w:
+					warnings.simplefilter('always')
+					obtained, missingParameters = _extractBrukerparams(filePath, queryItems, re.compile(r'^\$\$\W(.+?)\W+([\w-]+@[\w-]+)$'), raiseWarning=False)
+
+				self.assertEqual(len(w), 0)
+				self.assertEqual(obtained['RG'], '84.66')
+				self.assertEqual(obtained['Warnings'][:38], 'Parameter ##$UNKNOWNPARAM= not found.;')
+				self.assertEqual(missingParameters, ['##$UNKNOWNPARAM=', '##$OFFSET='])
+
+
+	def test_extractParams_batch_warning(self):
+		from nPYc.utilities.extractParams import extractParams
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			self.writeWatersRaw(tmpdirname, 'UnitTest_Sample1')
+			rawPath = self.writeWatersRaw(tmpdirname, 'UnitTest_Sample2')
+			os.remove(os.path.join(rawPath, '_INLET.INF'))
+
+			with warnings.catch_warnings(record=True) as w:
+				warnings.simplefilter('always')
+				obtained = extractParams(tmpdirname, 'Waters .raw')
+
+		messages = [str(warning.message) for warning in w if issubclass(warning.category, UserWarning)]
+		# One warning for the whole batch, listing the files missing each set of parameters
+		self.assertEqual(len(messages), 1)
+		self.assertTrue(messages[0].startswith('Parameters not found in 2 of 2 files: Source Temperature (°C), '))
+		self.assertIn(', TOF in UnitTest_Sample1; ', messages[0])
+		self.assertTrue(messages[0].endswith(', TOF, ColumnType:, Column Serial Number: in UnitTest_Sample2.'))
+		# details still recorded per file
+		warningsColumn = obtained.set_index('Sample File Name')['Warnings']
+		self.assertNotIn('Unable to open', warningsColumn['UnitTest_Sample1'])
+		self.assertIn('Unable to open ' + os.path.join(rawPath, '_INLET.INF') + ' for reading.', warningsColumn['UnitTest_Sample2'])
+
+
+	@unittest.skipIf(not hasattr(os, 'symlink'), 'Symbolic links not supported')
+	def test_extractParams_symlinked_folder(self):
+		from nPYc.utilities.extractParams import extractParams
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			os.makedirs(os.path.join(tmpdirname, 'batch1'))
+			self.writeWatersRaw(os.path.join(tmpdirname, 'batch1'), 'UnitTest_Sample1')
+			os.symlink(os.path.join(tmpdirname, 'batch1'), os.path.join(tmpdirname, 'batch1link'), target_is_directory=True)
+
+			with warnings.catch_warnings(record=True) as w:
+				warnings.simplefilter('always')
+				obtained = extractParams(tmpdirname, 'Waters .raw')
+
+		messages = [str(warning.message) for warning in w]
+		self.assertEqual(obtained.shape[0], 1)
+		self.assertEqual(obtained.loc[0, 'Sample File Name'], 'UnitTest_Sample1')
+		self.assertIn('1 data files found through more than one path, only read once.', messages)
+
+
+	def test_extractParams_extractWatersRAWParams_missing_file_once(self):
+		from nPYc.utilities.extractParams import extractWatersRAWParams
+
+		with tempfile.TemporaryDirectory() as tmpdirname:
+			filePath = self.writeWatersRaw(tmpdirname, 'UnitTest_Sample')
+			queryItems = dict()
+			queryItems['unknown.file'] = ['Resolution', 'Capillary (kV)', 'Sampling Cone']
+
+			with warnings.catch_warnings(record=True) as w:
+				warnings.simplefilter('always')
+				obtained = extractWatersRAWParams(filePath, queryItems)
+
+		# A missing file is reported once, not once per parameter read from it
+		messages = [str(warning.message) for warning in w]
+		self.assertEqual(messages, ['Unable to open ' + os.path.join(filePath, 'unknown.file') + ' for reading.'])
+		self.assertEqual(obtained['Warnings'], 'Unable to open ' + os.path.join(filePath, 'unknown.file') + ' for reading.')
@@ -1142,7 +1142,7 @@ class Dataset:
 		elif descriptionFormat == 'NPC Subject Info':
 			self._matchDatasetToSubjectInfo(filePath)
 		elif descriptionFormat == 'Raw Data':
-			self._getSampleMetadataFromRawData(filePath)
+			self._getSampleMetadataFromRawData(filePath, parallelise=kwargs.get('parallelise', False))
 		elif descriptionFormat == 'ISATAB':
 			self._matchDatasetToISATAB(filePath, **kwargs)
 		elif descriptionFormat == 'Filenames':
@@ -1355,7 +1355,7 @@ class Dataset:
 		"""
 		raise NotImplementedError
 
-	def _getSampleMetadataFromRawData(self, rawDataPath):
+	def _getSampleMetadataFromRawData(self, rawDataPath, parallelise=False):
 		"""
 		Pull metadata out of raw experiment files.
 		"""
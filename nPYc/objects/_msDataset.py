@@ -502,6 +502,7 @@ class MSDataset(Dataset):
 		:param str filePath: Path to the additional data to be added
 		:param filenameSpec: Only used if *descriptionFormat* is 'Filenames'. A regular expression that extracts sample-type information into the following named capture groups: 'fileName', 'baseName', 'study', 'chromatography' 'ionisation', 'instrument', 'groupingKind' 'groupingNo', 'injectionKind', 'injectionNo', 'reference', 'exclusion' 'reruns', 'extraInjections', 'exclusion2'. if ``None`` is passed, use the *filenameSpec* key in *Attributes*, loaded from the SOP json
 		:type filenameSpec: None or str
+		:param bool parallelise: Only used if *descriptionFormat* is 'Raw Data'. If ``True``, read the parameter files of several samples concurrently
 		:raises NotImplementedError: if the descriptionFormat is not understood
 		"""
 
@@ -859,16 +860,19 @@ class MSDataset(Dataset):
 		self.Attributes['Log'].append([datetime.now(), 'Metaboscape dataset loaded from %s' % (path)])
 
 
-	def _getSampleMetadataFromRawData(self, rawDataPath):
+	def _getSampleMetadataFromRawData(self, rawDataPath, parallelise=False):
 		"""
 		Pull metadata out of raw experiment files.
+
+		:param str rawDataPath: Path to folder of raw data
+		:param bool parallelise: If ``True``, read the parameter files of several samples concurrently
 		"""
 		# Validate inputs
 		if not os.path.isdir(rawDataPath):
 			raise ValueError('No directory found at %s' % (rawDataPath))
 
 		# Infer data format here - for now assume Waters RAW.
-		instrumentParams = getSampleMetadataFromWatersRawFiles(rawDataPath)
+		instrumentParams = getSampleMetadataFromWatersRawFiles(rawDataPath, parallelise=parallelise)
 
 		# Store the location
 		# Appending is supported to allow reading from multiple folders and directories
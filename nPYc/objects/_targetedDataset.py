@@ -5,6 +5,7 @@ Module for the import and manipulation of quantified targeted MS data sets.
 import copy
 import os
 import re
+import functools
 from datetime import datetime
 import numpy
 import pandas
@@ -12,7 +13,9 @@ import collections
 import warnings
 from .._toolboxPath import toolboxPath
 from ._dataset import Dataset
-from ..utilities import normalisation, rsd
+from ._nmrDataset import NMRDataset
+from ..utilities import rsd
+from ..utilities.extractParams import _scanBrukerFiles
 from ..enumerations import VariableType, AssayRole, SampleType, QuantificationType, CalibrationMethod, AnalyticalPlatform
 
 
@@ -168,6 +171,9 @@ class TargetedDataset(Dataset):
         * ``pdata``
             To select the right pdata folders (default 1)
 
+        * ``parallelise``
+            If ``True``, parse the xml files on multiple cores (default False)
+
         Two form of Bruker quantification results are supported and selected using the ``sop`` option: *BrukerQuant-UR* and *Bruker BI-LISA*
 
         * ``sop = 'BrukerQuant-UR'``
@@ -238,13 +244,14 @@ class TargetedDataset(Dataset):
         # Check we have Study Reference samples defined
         if not ('AssayRole' in self.sampleMetadata.keys() or 'SampleType' in self.sampleMetadata.keys()):
             raise ValueError('Assay Roles and Sample Types must be defined to calculate RSDs.')
-        if not sum(self.sampleMetadata['AssayRole'].values == AssayRole.PrecisionReference) > 1:
+        # Enum comparisons on object arrays are costly, scan each column only once
+        roleMask = self.sampleMetadata['AssayRole'].values == AssayRole.PrecisionReference
+        if numpy.count_nonzero(roleMask) < 2:
             raise ValueError('More than one precision reference is required to calculate RSDs.')
 
-        mask = numpy.logical_and(self.sampleMetadata['AssayRole'].values == AssayRole.PrecisionReference,
-                                 self.sampleMetadata['SampleType'].values == SampleType.StudyPool)
+        mask = roleMask & (self.sampleMetadata['SampleType'].values == SampleType.StudyPool) & self.sampleMask
 
-        return rsd(self._intensityData[mask & self.sampleMask])
+        return rsd(self._intensityData[mask])
 
     @property
     def rsdSS(self):
@@ -257,13 +264,13 @@ class TargetedDataset(Dataset):
         # Check we have Study Reference samples defined
         if not ('AssayRole' in self.sampleMetadata.keys() or 'SampleType' in self.sampleMetadata.keys()):
             raise ValueError('Assay Roles and Sample Types must be defined to calculate RSDs.')
-        if not sum(self.sampleMetadata['AssayRole'].values == AssayRole.Assay) > 1:
+        roleMask = self.sampleMetadata['AssayRole'].values == AssayRole.Assay
+        if numpy.count_nonzero(roleMask) < 2:
             raise ValueError('More than one assay sample is required to calculate RSDs.')
 
-        mask = numpy.logical_and(self.sampleMetadata['AssayRole'].values == AssayRole.Assay,
-                                 self.sampleMetadata['SampleType'].values == SampleType.StudySample)
+        mask = roleMask & (self.sampleMetadata['SampleType'].values == SampleType.StudySample) & self.sampleMask
 
-        return rsd(self._intensityData[mask & self.sampleMask])
+        return rsd(self._intensityData[mask])
 
     def _loadTargetLynxDataset(self, datapath, calibrationReportPath, keepIS=False, noiseFilled=False, keepPeakInfo=False, keepExcluded=False, **kwargs):
         """
@@ -357,16 +364,8 @@ class TargetedDataset(Dataset):
             delattr(self, 'excludedFlag')
 
         # clear **kwargs that have been copied to Attributes
-        for i in list(kwargs.keys()):
-            try:
-                del self.Attributes[i]
-            except:
-                pass
-        for j in ['keepIS','noiseFilled','keepPeakInfo','keepExcluded']:
-            try:
-                del self.Attributes[j]
-            except:
-                pass
+        for k in set(kwargs).union(['keepIS','noiseFilled','keepPeakInfo','keepExcluded']):
+            self.Attributes.pop(k, None)
 
 
     def _readTargetLynxDataset(self, datapath, calibrationReportPath, **kwargs):
@@ -1056,7 +1055,7 @@ class TargetedDataset(Dataset):
         self.Attributes['Log'].append([datetime.now(), '%d features kept for processing (%d samples). %d IS features filtered.' % (sum(keptFeat), self.noSamples, sum(ISFeat))])
 
 
-    def _loadBrukerXMLDataset(self, datapath, fileNamePattern=None, pdata=1, unit=None, **kwargs):
+    def _loadBrukerXMLDataset(self, datapath, fileNamePattern=None, pdata=1, unit=None, parallelise=False, **kwargs):
         """
         Initialise object from Bruker XML files. Read files and prepare a valid TargetedDataset.
 
@@ -1067,14 +1066,15 @@ class TargetedDataset(Dataset):
         :param int pdata: pdata files to parse (default 1)
         :param unit: if features are present more than once, only keep the features with the unit passed as input.
         :type unit: None or str
+        :param bool parallelise: If ``True``, parse the `xml` files on multiple cores
         :raises TypeError: if `fileNamePattern` is not a string
         :raises TypeError: if `pdata` is not an integer
         :raises TypeError: if `unit` is not 'None' or a string
+        :raises TypeError: if `parallelise` is not a bool
         :raises ValueError: if `unit` is not one of the unit in the input data
         :return: None
         """
         from ..utilities._readBrukerXML import importBrukerXML
-        from ..utilities.extractParams import buildFileList
 
         if fileNamePattern is None:
             fileNamePattern = self.Attributes['fileNamePattern']
@@ -1087,73 +1087,69 @@ class TargetedDataset(Dataset):
         if unit is not None:
             if not isinstance(unit, str):
                 raise TypeError('\'unit\' must be a string')
+        if not isinstance(parallelise, bool):
+            raise TypeError('\'parallelise\' must be True or False')
 
         ## Build a list of xml files matching the pdata in the right folder
-        pattern = re.compile(fileNamePattern)
-        filelist = buildFileList(datapath, pattern)
-        pdataPattern = re.compile('.*?pdata.*?%i' % (pdata))
-        filelist = [x for x in filelist if pdataPattern.match(x)]
+        filelist = list(_scanBrukerFiles(datapath, re.compile(fileNamePattern), _pdataPattern(pdata)))
 
         ## Load intensity, sampleMetadata and featureMetadata. Files that cannot be opened raise warnings, and are filtered from the returned matrices.
-        (self.intensityData, self.sampleMetadata, self.featureMetadata) = importBrukerXML(filelist)
+        (self.intensityData, self.sampleMetadata, self.featureMetadata) = importBrukerXML(filelist, parallelise=parallelise)
 
         ## Filter unit if required
         avUnit = self.featureMetadata['Unit'].unique().tolist()
+        keepMask = numpy.ones(self.featureMetadata.shape[0], dtype=bool)
         if unit is not None:
-            if unit not in self.featureMetadata['Unit'].unique().tolist():
+            if unit not in avUnit:
                 raise ValueError('The unit \'' + str(unit) + '\' is not present in the input data, available units: ' + str(avUnit))
             keepMask = (self.featureMetadata['Unit'] == unit).values
-            self.featureMetadata = self.featureMetadata.loc[keepMask, :]
-            self.featureMetadata.reset_index(drop=True, inplace=True)
-            self.intensityData = self.intensityData[:, keepMask]
 
         ## Check all features are unique, and
-        u_ids, u_counts = numpy.unique(self.featureMetadata['Feature Name'], return_counts=True)
-        if not all(u_counts == 1):
-            dupFeat = u_ids[u_counts != 1].tolist()
+        featureName = self.featureMetadata.loc[keepMask, 'Feature Name']
+        dupMask = featureName.duplicated(keep=False).values
+        if dupMask.any():
+            dupFeat = sorted(featureName[dupMask].unique().tolist())
             warnings.warn('The following features are present more than once, only the first occurence will be kept: ' + str(dupFeat) + '. For further filtering, available units are: ' + str(avUnit))
             # only keep the first of duplicated features
-            keepMask = ~self.featureMetadata['Feature Name'].isin(dupFeat).values
-            keepFirstVal = [(self.featureMetadata['Feature Name'] == Feat).idxmax() for Feat in dupFeat]
-            keepMask[keepFirstVal] = True
+            keepMask[keepMask] = ~featureName.duplicated(keep='first').values
+
+        # Apply the unit and duplicate filters in a single pass
+        if not keepMask.all():
             self.featureMetadata = self.featureMetadata.loc[keepMask, :]
             self.featureMetadata.reset_index(drop=True, inplace=True)
-            self.intensityData = self.intensityData[:, keepMask]
+            self.intensityData = self._intensityData[:, keepMask]
+        # float64 C-ordered storage for the vectorised LOQ comparisons (no copy if already the case)
+        self.intensityData = numpy.ascontiguousarray(self._intensityData, dtype=numpy.float64)
 
         ## Reformat featureMetadata
-        # quantificationType
-        self.featureMetadata['quantificationType'] = numpy.nan
-        self.featureMetadata.loc[self.featureMetadata['type'] == 'quantification', 'quantificationType'] = QuantificationType.QuantOther
-        self.featureMetadata.loc[self.featureMetadata['type'] != 'quantification', 'quantificationType'] = QuantificationType.Monitored
+        # quantificationType and calibrationMethod, both derived from the same 'type' mask
+        quantifiedMask = (self.featureMetadata['type'] == 'quantification').values
+        self.featureMetadata['quantificationType'] = numpy.where(quantifiedMask, QuantificationType.QuantOther, QuantificationType.Monitored)
+        self.featureMetadata['calibrationMethod'] = numpy.where(quantifiedMask, CalibrationMethod.otherCalibration, CalibrationMethod.noCalibration)
         self.featureMetadata.drop('type', inplace=True, axis=1)
-        # calibrationMethod
-        self.featureMetadata['calibrationMethod'] = numpy.nan
-        self.featureMetadata.loc[self.featureMetadata['quantificationType'] == QuantificationType.QuantOther, 'calibrationMethod'] = CalibrationMethod.otherCalibration
-        self.featureMetadata.loc[self.featureMetadata['quantificationType'] == QuantificationType.Monitored, 'calibrationMethod'] = CalibrationMethod.noCalibration
         # rename columns
         self.featureMetadata.rename(columns={'loq': 'LLOQ', 'lod': 'LOD', 'Lower Reference Bound': 'Lower Reference Percentile', 'Upper Reference Bound': 'Upper Reference Percentile'}, inplace=True)
-        # replace '-' with nan
-        self.featureMetadata['LLOQ'].replace('-', numpy.nan, inplace=True)
-        self.featureMetadata['LLOQ'] = [float(x) for x in self.featureMetadata['LLOQ'].tolist()]
-        self.featureMetadata['LOD'].replace('-', numpy.nan, inplace=True)
-        self.featureMetadata['LOD'] = [float(x) for x in self.featureMetadata['LOD'].tolist()]
+        # replace '-' with nan and convert to float
+        self.featureMetadata['LLOQ'] = pandas.to_numeric(self.featureMetadata['LLOQ'].replace('-', numpy.nan), errors='coerce').astype(numpy.float64)
+        self.featureMetadata['LOD'] = pandas.to_numeric(self.featureMetadata['LOD'].replace('-', numpy.nan), errors='coerce').astype(numpy.float64)
         # ULOQ
         self.featureMetadata['ULOQ'] = numpy.nan
 
         ## Initialise sampleMetadata
         self.sampleMetadata['AssayRole'] = numpy.nan
         self.sampleMetadata['SampleType'] = numpy.nan
-        self.sampleMetadata['Dilution'] = 100
+        self.sampleMetadata['Dilution'] = numpy.full(self.sampleMetadata.shape[0], 100, dtype=numpy.int64)
         self.sampleMetadata['Correction Batch'] = numpy.nan
         self.sampleMetadata['Sample ID'] = numpy.nan
         self.sampleMetadata['Exclusion Details'] = None
-        # add Run Order
-        self.sampleMetadata['Order'] = self.sampleMetadata.sort_values(by='Acquired Time').index
-        self.sampleMetadata['Run Order'] = self.sampleMetadata.sort_values(by='Order').index
-        self.sampleMetadata.drop('Order', axis=1, inplace=True)
+        # add Run Order, the rank of each sample by acquisition time (inverse of the sorting permutation)
+        acquiredOrder = self.sampleMetadata['Acquired Time'].sort_values().index.values
+        runOrder = numpy.empty_like(acquiredOrder)
+        runOrder[acquiredOrder] = numpy.arange(acquiredOrder.size)
+        self.sampleMetadata['Run Order'] = runOrder
         # initialise the Batch to 1
-        self.sampleMetadata['Batch'] = [1] * self.sampleMetadata.shape[0]
-        self.sampleMetadata['Metadata Available'] = False
+        self.sampleMetadata['Batch'] = numpy.ones(self.sampleMetadata.shape[0], dtype=numpy.int64)
+        self.sampleMetadata['Metadata Available'] = numpy.zeros(self.sampleMetadata.shape[0], dtype=bool)
 
         ## Initialise expectedConcentration
         self.expectedConcentration = pandas.DataFrame(None, index=list(self.sampleMetadata.index), columns=self.featureMetadata['Feature Name'].tolist())
@@ -1176,16 +1172,8 @@ class TargetedDataset(Dataset):
         self._applyLimitsOfQuantification(**kwargs)
 
         ## clear **kwargs that have been copied to Attributes
-        for i in list(kwargs.keys()):
-            try:
-                del self.Attributes[i]
-            except:
-                pass
-        for j in ['fileNamePattern', 'pdata', 'unit']:
-            try:
-                del self.Attributes[j]
-            except:
-                pass
+        for k in set(kwargs).union(['fileNamePattern', 'pdata', 'unit', 'parallelise']):
+            self.Attributes.pop(k, None)
 
 
     def _applyLimitsOfQuantification(self, onlyLLOQ=False, **kwargs):
@@ -1212,7 +1200,8 @@ class TargetedDataset(Dataset):
 
         sampleMetadata        = copy.deepcopy(self.sampleMetadata)
         featureMetadata       = copy.deepcopy(self.featureMetadata)
-        intensityData         = copy.deepcopy(self._intensityData)
+        # not copied, the limits replacement below copies it if it is still self._intensityData
+        intensityData         = self._intensityData
         expectedConcentration = copy.deepcopy(self.expectedConcentration)
         calibration           = copy.deepcopy(self.calibration)
         if ((not hasattr(self, 'sampleMetadataExcluded')) | (not hasattr(self, 'featureMetadataExcluded')) | (not hasattr(self, 'intensityDataExcluded')) | (not hasattr(self, 'expectedConcentrationExcluded')) | (not hasattr(self, 'excludedFlag'))):
@@ -1279,18 +1268,13 @@ class TargetedDataset(Dataset):
 
 
         ## Values replacement (-inf / +inf)
-        # iterate over the features
-        for i in range(0, featureMetadata.shape[0]):
-            # LLOQ
-            if not numpy.isnan(featureMetadata['LLOQ'].values[i]):
-                toReplaceLLOQ = intensityData[:, i] < featureMetadata['LLOQ'].values[i]
-                intensityData[toReplaceLLOQ, i] = -numpy.inf
-
-            # ULOQ
+        # all features at once, NaN limits never match and leave the feature unaltered
+        # both replacements are written in place, intensityData is only copied if not already a new array from the feature slicing above
+        intensityData = numpy.array(intensityData, dtype=float, copy=intensityData is self._intensityData)
+        with numpy.errstate(invalid='ignore'):
+            numpy.copyto(intensityData, -numpy.inf, where=intensityData < featureMetadata['LLOQ'].values.astype(float))
             if not onlyLLOQ:
-                if not numpy.isnan(featureMetadata['ULOQ'].values[i]):
-                    toReplaceULOQ = intensityData[:, i] > featureMetadata['ULOQ'].values[i]
-                    intensityData[toReplaceULOQ, i] = numpy.inf
+                numpy.copyto(intensityData, numpy.inf, where=intensityData > featureMetadata['ULOQ'].values.astype(float))
 
 
         ## Add back the untouched monitored features
@@ -1659,6 +1643,12 @@ class TargetedDataset(Dataset):
                     result.append(el)
             return result
 
+        def asList(x):
+            """ Always provide a list, from a list (already single level after a previous __add__) or a str """
+            if isinstance(x, list):
+                return x
+            return [x]
+
         def reNumber(oldSeries, startNb):
             """ reindex a series of int between the startNB and startNb + number of unique values """
             oldNb = oldSeries.unique().tolist()
@@ -1681,7 +1671,7 @@ class TargetedDataset(Dataset):
             """
             import re
 
-            newList = copy.deepcopy(oldList)
+            newList = list(oldList)
 
             ## Append'_batchX' with X the smallest original 'Batch' if none already present
             for i in range(len(newList)):
@@ -1769,9 +1759,10 @@ class TargetedDataset(Dataset):
         if not validOtherDataset['BasicTargetedDataset']:
             raise ValueError('other does not satisfy to the Basic TargetedDataset definition, check with other.validateObject(verbose=True, raiseError=False)')
         # Warning if duplicate 'Sample File Name' in sampleMetadata
-        u_ids, u_counts = numpy.unique(pandas.concat([self.sampleMetadata['Sample File Name'], other.sampleMetadata['Sample File Name']],ignore_index=True, sort=False), return_counts=True)
-        if any(u_counts > 1):
-            warnings.warn('Warning: The following \'Sample File Name\' are present more than once: ' + str(u_ids[u_counts>1].tolist()))
+        sampleFileName = pandas.concat([self.sampleMetadata['Sample File Name'], other.sampleMetadata['Sample File Name']],ignore_index=True, sort=False, copy=False)
+        duplicatedSampleFileName = sampleFileName.duplicated()
+        if duplicatedSampleFileName.any():
+            warnings.warn('Warning: The following \'Sample File Name\' are present more than once: ' + str(sorted(sampleFileName[duplicatedSampleFileName].unique().tolist())))
 
         if self.AnalyticalPlatform != other.AnalyticalPlatform:
             raise ValueError('Can only add Targeted datasets with the same AnalyticalPlatform Attribute')
@@ -1783,27 +1774,23 @@ class TargetedDataset(Dataset):
         ## Attributes
         if self.Attributes['methodName'] != other.Attributes['methodName']:
             raise ValueError('Cannot concatenate different targeted methods: \''+ self.Attributes['methodName'] +'\' and \''+ other.Attributes['methodName'] +'\'')
-        # copy from the first (mainly dataset parameters, methodName, chromatography and ionisation)
-        targetedData.Attributes = copy.deepcopy(self.Attributes)
+        # copy from the first (mainly dataset parameters, methodName, chromatography and ionisation), the Log is not copied as it is replaced
+        targetedData.Attributes = {key: value if key == 'Log' else copy.deepcopy(value) for key, value in self.Attributes.items()}
         # append both logs
         targetedData.Attributes['Log'] = self.Attributes['Log'] + other.Attributes['Log']
 
-        ## _Normalisation
-        targetedData._Normalisation = normalisation.NullNormaliser()
-
-        ## VariableType
-        targetedData.VariableType = copy.deepcopy(self.VariableType)
-
-        targetedData.AnalyticalPlatform = copy.deepcopy(self.AnalyticalPlatform)
+        ## VariableType and AnalyticalPlatform (enum members, no copy required)
+        targetedData.VariableType = self.VariableType
+        targetedData.AnalyticalPlatform = self.AnalyticalPlatform
 
         ## _name
         targetedData.name = self.name+'-'+other.name
 
         ## fileName
-        targetedData.fileName = flatten([self.fileName, other.fileName])
+        targetedData.fileName = asList(self.fileName) + asList(other.fileName)
 
         ## filePath
-        targetedData.filePath = flatten([self.filePath, other.filePath])
+        targetedData.filePath = asList(self.filePath) + asList(other.filePath)
 
         ## sampleMetadata
         tmpSampleMetadata1 = copy.deepcopy(self.sampleMetadata)
@@ -1812,13 +1799,14 @@ class TargetedDataset(Dataset):
         tmpSampleMetadata1['Batch'], batchChangeSelf  = reNumber(tmpSampleMetadata1['Batch'], 1)
         tmpSampleMetadata2['Batch'], batchChangeOther = reNumber(tmpSampleMetadata2['Batch'], tmpSampleMetadata1['Batch'].values.max()+1)
         # Concatenate samples and reinitialise index
-        sampleMetadata = pandas.concat([tmpSampleMetadata1, tmpSampleMetadata2], ignore_index=True, sort=False)
-        # Update Run Order
-        sampleMetadata['Order'] = sampleMetadata.sort_values(by='Acquired Time').index
-        sampleMetadata['Run Order'] = sampleMetadata.sort_values(by='Order').index
-        sampleMetadata.drop('Order', axis=1, inplace=True)
+        sampleMetadata = pandas.concat([tmpSampleMetadata1, tmpSampleMetadata2], ignore_index=True, sort=False, copy=False)
+        # Update Run Order, rank of each sample 'Acquired Time' (the index is a RangeIndex, sorted index labels are positions)
+        acquiredOrder = sampleMetadata['Acquired Time'].sort_values().index.values
+        runOrder = numpy.empty(acquiredOrder.shape[0], dtype='int64')
+        runOrder[acquiredOrder] = numpy.arange(acquiredOrder.shape[0])
+        sampleMetadata['Run Order'] = runOrder
         # new sampleMetadata
-        targetedData.sampleMetadata = copy.deepcopy(sampleMetadata)
+        targetedData.sampleMetadata = sampleMetadata
 
 
         ## featureMetadata
@@ -1833,16 +1821,16 @@ class TargetedDataset(Dataset):
             for col in targetedData.Attributes['additionalQuantParamColumns']:
                 if (col in self.featureMetadata.columns) and (col in other.featureMetadata.columns) and (col not in mergeCol):
                     mergeCol.append(col)
-        # take each dataset featureMetadata column names, modify them and rename columns
-        tmpFeatureMetadata1 = copy.deepcopy(self.featureMetadata)
+        # take each dataset featureMetadata column names, modify them and rename columns (only the columns are changed, a shallow copy leaves the inputs untouched)
+        tmpFeatureMetadata1 = self.featureMetadata.copy(deep=False)
         updatedCol1 = batchListReNumber(tmpFeatureMetadata1.columns.tolist(), batchChangeSelf, mergeCol)
         tmpFeatureMetadata1.columns = updatedCol1
-        tmpFeatureMetadata2 = copy.deepcopy(other.featureMetadata)
+        tmpFeatureMetadata2 = other.featureMetadata.copy(deep=False)
         updatedCol2 = batchListReNumber(tmpFeatureMetadata2.columns.tolist(), batchChangeOther, mergeCol)
         tmpFeatureMetadata2.columns = updatedCol2
         # Merge featureMetadata on the mergeCol, no columns with identical name exist
         tmpFeatureMetadata = tmpFeatureMetadata1.merge(tmpFeatureMetadata2, how='outer', on=mergeCol, left_on=None,right_on=None,left_index=False,right_index=False,sort=False,copy=True,indicator=False)
-        targetedData.featureMetadata = copy.deepcopy(tmpFeatureMetadata)
+        targetedData.featureMetadata = tmpFeatureMetadata
 
         ## featureMetadataNotExported
         # add _batchX to the column names to exclude. The expected columns are 'mergeCol' from featureMetadata. No modification for sampleMetadataNotExported which has been copied with the other Attributes (and is an SOP parameter)
@@ -1853,24 +1841,29 @@ class TargetedDataset(Dataset):
 
         ## _intensityData
         # samples are simply concatenated, but features are merged. Reproject each dataset on the merge feature list before concatenation.
-        # init with nan
-        intensityData1 = numpy.full([self._intensityData.shape[0], targetedData.featureMetadata.shape[0]], numpy.nan)
-        intensityData2 = numpy.full([other._intensityData.shape[0], targetedData.featureMetadata.shape[0]], numpy.nan)
-        # iterate over the merged features
-        for i in range(targetedData.featureMetadata.shape[0]):
-            featureName = targetedData.featureMetadata.loc[i,'Feature Name']
-            featurePosition1 = self.featureMetadata['Feature Name'] == featureName
-            featurePosition2 = other.featureMetadata['Feature Name'] == featureName
-            if sum(featurePosition1)==1:
-                intensityData1[:,i] = self._intensityData[:,featurePosition1].ravel()
-            elif sum(featurePosition1)>1:
-                raise ValueError('Duplicate feature name in first input: ' + featureName)
-            if sum(featurePosition2)==1:
-                intensityData2[:, i] = other._intensityData[:, featurePosition2].ravel()
-            elif sum(featurePosition2) > 1:
-                raise ValueError('Duplicate feature name in second input: ' + featureName)
-        intensityData = numpy.concatenate([intensityData1,intensityData2], axis=0)
-        targetedData._intensityData = copy.deepcopy(intensityData)
+        # position of each merged feature in both inputs (-1 if absent), feature names must be unique for the lookup
+        mergedFeatureName = pandas.Index(targetedData.featureMetadata['Feature Name'])
+        featureName1 = pandas.Index(self.featureMetadata['Feature Name'])
+        featureName2 = pandas.Index(other.featureMetadata['Feature Name'])
+        if not featureName1.is_unique:
+            raise ValueError('Duplicate feature name in first input: ' + featureName1[featureName1.duplicated()][0])
+        if not featureName2.is_unique:
+            raise ValueError('Duplicate feature name in second input: ' + featureName2[featureName2.duplicated()][0])
+        featurePosition1 = featureName1.get_indexer(mergedFeatureName)
+        featurePosition2 = featureName2.get_indexer(mergedFeatureName)
+        featurePresent1 = featurePosition1 != -1
+        featurePresent2 = featurePosition2 != -1
+        if mergedFeatureName.equals(featureName1) and mergedFeatureName.equals(featureName2):
+            # same features in the same order (e.g. batch acquired with the same SOP), samples are simply stacked
+            intensityData = numpy.concatenate([self._intensityData, other._intensityData], axis=0).astype(float, copy=False)
+        else:
+            # init with nan, self samples first then other samples
+            noSamples1 = self._intensityData.shape[0]
+            intensityData = numpy.full([noSamples1 + other._intensityData.shape[0], targetedData.featureMetadata.shape[0]], numpy.nan)
+            # gather the columns of features present in each input
+            intensityData[:noSamples1, featurePresent1] = self._intensityData[:, featurePosition1[featurePresent1]]
+            intensityData[noSamples1:, featurePresent2] = other._intensityData[:, featurePosition2[featurePresent2]]
+        targetedData._intensityData = intensityData
 
 
         ## expectedConcentration
@@ -1883,9 +1876,9 @@ class TargetedDataset(Dataset):
                 expectedConc1.loc[:,colname] = self.expectedConcentration[colname].ravel()
             if colname in other.expectedConcentration.columns:
                 expectedConc2.loc[:,colname] = other.expectedConcentration[colname].ravel()
-        expectedConcentration = pandas.concat([expectedConc1, expectedConc2], axis=0, ignore_index=True, sort=False)
+        expectedConcentration = pandas.concat([expectedConc1, expectedConc2], axis=0, ignore_index=True, sort=False, copy=False)
         expectedConcentration.reset_index(drop=True, inplace=True)
-        targetedData.expectedConcentration = copy.deepcopy(expectedConcentration)
+        targetedData.expectedConcentration = expectedConcentration
 
 
         ## Masks
@@ -1894,22 +1887,16 @@ class TargetedDataset(Dataset):
         targetedData.sampleMask = numpy.concatenate([self.sampleMask, other.sampleMask], axis=0)
         # featureMask
         # if featureMask agree in both, keep that value. Otherwise let the default True value. If feature exist only in one, use that value.
-        if (sum(~self.featureMask)!=0) | (sum(~other.featureMask)!=0):
+        # if both featureMask are all True, the merged one is all True as initialised
+        if not (self.featureMask.all() and other.featureMask.all()):
             warnings.warn("Warning: featureMask are not empty, they will be merged. If both featureMasks do not agree, the default \'True\' value will be set. If the feature is only present in one dataset, the corresponding featureMask value will be kept.")
-        for i in range(targetedData.featureMetadata.shape[0]):
-            featureName = targetedData.featureMetadata.loc[i, 'Feature Name']
-            featurePosition1 = self.featureMetadata['Feature Name'] == featureName
-            featurePosition2 = other.featureMetadata['Feature Name'] == featureName
-            # if both exist
-            if (sum(featurePosition1)==1) & (sum(featurePosition2)==1):
-                # only False if both are False (otherwise True, same as default)
-                targetedData.featureMask[i] = self.featureMask[featurePosition1] | other.featureMask[featurePosition2]
-            # if feature only exist in first input
-            elif sum(featurePosition1==1):
-                targetedData.featureMask[i] = self.featureMask[featurePosition1]
-            # if feature only exist in second input
-            elif sum(featurePosition2==1):
-                targetedData.featureMask[i] = other.featureMask[featurePosition2]
+            # gather each input featureMask on the merged features (reusing the positions from _intensityData), False where the feature is absent.
+            # if both exist only False if both are False (otherwise True, same as default), if feature only exist in one input the OR keeps that value
+            featureMask1 = numpy.zeros(targetedData.featureMetadata.shape[0], dtype=bool)
+            featureMask2 = numpy.zeros(targetedData.featureMetadata.shape[0], dtype=bool)
+            featureMask1[featurePresent1] = self.featureMask[featurePosition1[featurePresent1]]
+            featureMask2[featurePresent2] = other.featureMask[featurePosition2[featurePresent2]]
+            targetedData.featureMask = featureMask1 | featureMask2
 
 
         ## Excluded data with applyMask()
@@ -1951,18 +1938,12 @@ class TargetedDataset(Dataset):
 
 
         ## unexpected attributes
-        expectedAttr = {'Attributes', 'VariableType', 'AnalyticalPlatform', '_Normalisation', '_name', 'fileName', 'filePath',
-                        '_intensityData', 'sampleMetadata', 'featureMetadata', 'expectedConcentration','sampleMask',
-                        'featureMask', 'calibration', 'sampleMetadataExcluded', 'intensityDataExcluded',
-                        'featureMetadataExcluded', 'expectedConcentrationExcluded', 'excludedFlag'}
-        selfAttr = set(self.__dict__.keys())
-        selfAdditional = selfAttr - expectedAttr
-        otherAttr = set(other.__dict__.keys())
-        otherAdditional = otherAttr - expectedAttr
+        selfAdditional = self.__dict__.keys() - _mergedAttributes
+        otherAdditional = other.__dict__.keys() - _mergedAttributes
         # identify common and unique
-        commonAttr = selfAdditional.intersection(otherAdditional)
-        onlySelfAttr = selfAdditional - commonAttr
-        onlyOtherAttr = otherAdditional - commonAttr
+        commonAttr = selfAdditional & otherAdditional
+        onlySelfAttr = selfAdditional - otherAdditional
+        onlyOtherAttr = otherAdditional - selfAdditional
         # save a list [self, other] for each attribute
         if bool(commonAttr):
             print('The following additional attributes are present in both datasets and stored as lists:')
@@ -2021,8 +2002,9 @@ class TargetedDataset(Dataset):
         :raises Warning: if :py:attr:`featureMetadata['LLOQ']` or :py:attr:`featureMetadata['ULOQ']` already exist and will be overwritten.
         """
 
-        # Check dataset is fit for merging LOQ
-        validateDataset = copy.deepcopy(self)
+        # Check dataset is fit for merging LOQ (validateObject appends to the Log, validate a shallow copy with its own Attributes)
+        validateDataset = copy.copy(self)
+        validateDataset.Attributes = copy.deepcopy(self.Attributes)
         validDataset = validateDataset.validateObject(verbose=False, raiseError=False, raiseWarning=False)
         if not validDataset['BasicTargetedDataset']:
             raise ValueError('Import Error: targetedData does not satisfy to the BasicTargetedDataset definition')
@@ -2052,7 +2034,8 @@ class TargetedDataset(Dataset):
         self._applyLimitsOfQuantification(onlyLLOQ=onlyLLOQ)
 
         # run validation on the merged LOQ
-        validateMergeDataset = copy.deepcopy(self)
+        validateMergeDataset = copy.copy(self)
+        validateMergeDataset.Attributes = copy.deepcopy(self.Attributes)
         validMergedDataset = validateMergeDataset.validateObject(verbose=False, raiseError=False, raiseWarning=False)
         if not validMergedDataset['BasicTargetedDataset']:
             raise ValueError('The merged LOQ dataset does not satisfy to the Basic TargetedDataset definition')
@@ -2072,8 +2055,10 @@ class TargetedDataset(Dataset):
         # handle the dilution due to method... These lines are left here commented - as hopefully this will be handled more
         # elegantly through the intensityData getter
         # Export dataset...
-        tmpData = copy.deepcopy(self)
-        tmpData._intensityData = tmpData._intensityData * (100/tmpData.sampleMetadata['Dilution']).values[:, numpy.newaxis]
+        # Only the intensityData is scaled, export a shallow copy (with its own Attributes as the export is logged) instead of copying the whole dataset
+        tmpData = copy.copy(self)
+        tmpData.Attributes = copy.deepcopy(self.Attributes)
+        tmpData._intensityData = self._intensityData * (100/self.sampleMetadata['Dilution']).values[:, numpy.newaxis]
         super(TargetedDataset, tmpData).exportDataset(destinationPath=destinationPath, saveFormat=saveFormat, withExclusions=withExclusions, escapeDelimiters=escapeDelimiters, filterMetadata=filterMetadata)
 
 
@@ -2094,27 +2079,12 @@ class TargetedDataset(Dataset):
         sampleMetadata = self.sampleMetadata.copy(deep=True)
         featureMetadata = self.featureMetadata.copy(deep=True)
 
-        intensityData = copy.deepcopy(self._intensityData)
-        intensityData = pandas.DataFrame(intensityData)
-        intensityData.replace(to_replace=-numpy.inf, value='<LLOQ', inplace=True)
-        intensityData.replace(to_replace= numpy.inf, value='>ULOQ', inplace=True)
+        intensityData = pandas.DataFrame(self._intensityData).replace({-numpy.inf: '<LLOQ', numpy.inf: '>ULOQ'})
 
         if escapeDelimiters:
             # Remove any commas from metadata/feature tables - for subsequent import of resulting csv files to other software packages
-
-            for column in sampleMetadata.columns:
-                try:
-                    if type(sampleMetadata[column][0]) is not datetime:
-                        sampleMetadata[column] = sampleMetadata[column].str.replace(',', ';')
-                except:
-                    pass
-
-            for column in featureMetadata.columns:
-                try:
-                    if type(featureMetadata[column][0]) is not datetime:
-                        featureMetadata[column] = featureMetadata[column].str.replace(',', ';')
-                except:
-                    pass
+            _escapeDelimiters(sampleMetadata)
+            _escapeDelimiters(featureMetadata)
 
         # Export sample metadata
         sampleMetadata.to_csv(destinationPath + '_sampleMetadata.csv', encoding='utf-8', date_format=self._timestampFormat)
@@ -2141,41 +2111,30 @@ class TargetedDataset(Dataset):
         sampleMetadata = self.sampleMetadata.copy(deep=True)
         featureMetadata = self.featureMetadata.copy(deep=True)
 
-        intensityData = copy.deepcopy(self._intensityData)
-        intensityData = pandas.DataFrame(intensityData)
-        intensityData.replace(to_replace=-numpy.inf, value='<LLOQ', inplace=True)
-        intensityData.replace(to_replace=numpy.inf, value='>ULOQ', inplace=True)
-
         if escapeDelimiters:
             # Remove any commas from metadata/feature tables - for subsequent import of resulting csv files to other software packages
+            _escapeDelimiters(sampleMetadata)
+            _escapeDelimiters(featureMetadata)
 
-            for column in sampleMetadata.columns:
-                try:
-                    if type(sampleMetadata[column][0]) is not datetime:
-                        sampleMetadata[column] = sampleMetadata[column].str.replace(',', ';')
-                except:
-                    pass
+        # sample metadata integer columns are written as float, as they are left empty on the feature metadata rows
+        intColumns = sampleMetadata.select_dtypes(include='integer').columns
+        sampleMetadata[intColumns] = sampleMetadata[intColumns].astype(float)
 
-            for column in featureMetadata.columns:
-                try:
-                    if type(featureMetadata[column][0]) is not datetime:
-                        featureMetadata[column] = featureMetadata[column].str.replace(',', ';')
-                except:
-                    pass
+        combinedPath = destinationPath + '_combinedData.csv'
 
-        # Export combined data in single file
-        tmpXCombined = pandas.concat([featureMetadata.transpose(), intensityData], axis=0, sort=False)
+        # Header, then one row per featureMetadata column, sample metadata columns left empty
+        pandas.DataFrame(columns=sampleMetadata.columns.append(featureMetadata.index)).to_csv(combinedPath, encoding='utf-8')
+        emptySampleColumns = [None] * sampleMetadata.shape[1]
+        for column in featureMetadata.columns:
+            featureRow = pandas.DataFrame([emptySampleColumns + featureMetadata[column].astype(object).tolist()], index=[column], dtype=object)
+            featureRow.to_csv(combinedPath, mode='a', header=False, encoding='utf-8', date_format=self._timestampFormat)
 
-        with warnings.catch_warnings():
-            # Seems no way to avoid pandas complaining here (v0.18.1)
-            warnings.simplefilter("ignore")
-            tmpCombined = pandas.concat([sampleMetadata, tmpXCombined], axis=1, sort=False)
-
-        # reorder rows to put metadata first
-        tmpCombined = tmpCombined.reindex(tmpXCombined.index, axis=0)
-
-        # Save
-        tmpCombined.to_csv(os.path.join(destinationPath + '_combinedData.csv'), encoding='utf-8', date_format=self._timestampFormat)
+        # Append the samples by blocks of rows, avoiding a combined copy of the whole intensityData
+        for start in range(0, sampleMetadata.shape[0], _exportChunkSize):
+            stop = start + _exportChunkSize
+            intensityData = pandas.DataFrame(self._intensityData[start:stop, :], index=sampleMetadata.index[start:stop]).replace({-numpy.inf: '<LLOQ', numpy.inf: '>ULOQ'})
+            sampleRows = pandas.concat([sampleMetadata.iloc[start:stop, :], intensityData], axis=1, sort=False)
+            sampleRows.to_csv(combinedPath, mode='a', header=False, encoding='utf-8', date_format=self._timestampFormat)
 
 
     def validateObject(self, verbose=True, raiseError=False, raiseWarning=True):
@@ -2209,7 +2168,7 @@ class TargetedDataset(Dataset):
         :type verbose: bool
         :param raiseError: if True an error is raised when a check fails and the validation is interrupted (default False)
         :type raiseError: bool
-        :param raiseWarning: if True a warning is raised when a check fails
+        :param raiseWarning: if True a single warning listing all the failed checks is raised at the end of the validation
         :type raiseWarning: bool
         :return: A dictionary of 4 boolean with True if the Object conforms to the corresponding test. 'Dataset' conforms to :py:class:`Dataset`, 'BasicTargetedDataset' conforms to :py:class:`Dataset` + basic :py:class:`TargetedDataset`, 'QC' BasicTargetedDataset + object has QC parameters, 'sampleMetadata' QC + object has sample metadata information
         :rtype: dict
@@ -2280,20 +2239,26 @@ class TargetedDataset(Dataset):
         """
 
         def conditionTest(successCond, successMsg, failureMsg, allFailures, verb, raiseErr, raiseWarn, exception):
+            # messages can be callables, only built when used; exception is the class raised with the failure message
+            # failures are warned all at once at the end of the validation (failuresToWarn), unless the validation is interrupted
             if not successCond:
-                allFailures.append(failureMsg)
-                msg = failureMsg
+                msg = failureMsg() if callable(failureMsg) else failureMsg
+                allFailures.append(msg)
                 if raiseWarn:
-                    warnings.warn(msg)
+                    if raiseErr:
+                        warnings.warn(msg)
+                    else:
+                        failuresToWarn.append(msg)
                 if raiseErr:
-                    raise exception
-            else:
-                msg = successMsg
+                    raise exception(msg)
+            elif verb:
+                msg = successMsg() if callable(successMsg) else successMsg
             if verb:
                 print(msg)
             return (allFailures)
 
         ## init
+        failuresToWarn   = []
         failureListBasic = []
         failureListQC    = []
         failureListMeta  = []
@@ -2304,98 +2269,90 @@ class TargetedDataset(Dataset):
         refFeatureName = None
         # reference number of calibration samples, from calibration['calibIntensityData']
         refNumCalibSamples = None
-        # reference number of exclusions in list, from sampleMetadataExcluded
-        refNumExcluded = None
 
-        # First check it conforms to Dataset
+        # First check it conforms to Dataset. Existence and type of the Dataset attributes, masks and exclusion lists are only checked there and are not repeated below
         if super().validateObject(verbose=verbose, raiseError=raiseError, raiseWarning=raiseWarning):
+            sampleMetadata = self.sampleMetadata
+            featureMetadata = self.featureMetadata
+            attributes = self.Attributes
             ## Check object class
             condition = isinstance(self, TargetedDataset)
             success = 'Check Object class:\tOK'
             failure = 'Check Object class:\tFailure, not TargetedDataset, but ' + str(type(self))
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-
-            ## Attributes
-            ## methodName
-            # exist
-            condition = 'methodName' in self.Attributes
-            success = 'Check self.Attributes[\'methodName\'] exists:\tOK'
-            failure = 'Check self.Attributes[\'methodName\'] exists:\tFailure, no attribute \'self.Attributes[\'methodName\']\''
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
-            if condition:
-                # is a str
-                condition = isinstance(self.Attributes['methodName'], str)
-                success = 'Check self.Attributes[\'methodName\'] is a str:\tOK'
-                failure = 'Check self.Attributes[\'methodName\'] is a str:\tFailure, \'self.Attributes[\'methodName\']\' is ' + str(type(self.Attributes['methodName']))
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-            # end self.Attributes['methodName']
-            ## externalID
-            # exist
-            condition = 'externalID' in self.Attributes
-            success = 'Check self.Attributes[\'externalID\'] exists:\tOK'
-            failure = 'Check self.Attributes[\'externalID\'] exists:\tFailure, no attribute \'self.Attributes[\'externalID\']\''
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
-            if condition:
-                # is a list
-                condition = isinstance(self.Attributes['externalID'], list)
-                success = 'Check self.Attributes[\'externalID\'] is a list:\tOK'
-                failure = 'Check self.Attributes[\'externalID\'] is a list:\tFailure, \'self.Attributes[\'externalID\']\' is ' + str(type(self.Attributes['externalID']))
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-            # end self.Attributes['externalID']
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
+
+            ## Attributes, see _attributesSchema
+            for key, keyType, description in _attributesSchema:
+                # exist
+                condition = key in attributes
+                success = 'Check self.Attributes[\'' + key + '\'] exists:\tOK'
+                failure = 'Check self.Attributes[\'' + key + '\'] exists:\tFailure, no attribute \'self.Attributes[\'' + key + '\']\''
+                conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
+                if condition:
+                    # is of the expected type
+                    condition = isinstance(attributes[key], keyType)
+                    success = 'Check self.Attributes[\'' + key + '\'] ' + description + ':\tOK'
+                    failure = 'Check self.Attributes[\'' + key + '\'] ' + description + ':\tFailure, \'self.Attributes[\'' + key + '\']\' is ' + str(type(attributes[key]))
+                    conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
+            # end self.Attributes
 
             ## self.VariableType
             # is a enum VariableType
             condition = isinstance(self.VariableType, VariableType)
             success = 'Check self.VariableType is an enum \'VariableType\':\tOK'
             failure = 'Check self.VariableType is an enum \'VariableType\':\tFailure, \'self.VariableType\' is' + str(type(self.VariableType))
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
             # end Variabletype
 
             ## self.fileName
             # exist
-            condition = hasattr(self, 'fileName')
+            fileName = getattr(self, 'fileName', _MISSING)
+            condition = fileName is not _MISSING
             success = 'Check self.fileName exists:\tOK'
             failure = 'Check self.fileName exists:\tFailure, no attribute \'self.fileName\''
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
             if condition:
                 # is a str
-                condition = isinstance(self.fileName, (str, list))
+                condition = isinstance(fileName, (str, list))
                 success = 'Check self.fileName is a str or list:\tOK'
-                failure = 'Check self.fileName is a str or list:\tFailure, \'self.fileName\' is ' + str(type(self.fileName))
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                if isinstance(self.fileName, list):
-                    for i in range(len(self.fileName)):
-                        condition = isinstance(self.fileName[i], (str))
+                failure = 'Check self.fileName is a str or list:\tFailure, \'self.fileName\' is ' + str(type(fileName))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
+                # each element is only checked individually if the result of each check is printed or if an element is not a str
+                if isinstance(fileName, list) and (verbose or not all(isinstance(value, str) for value in fileName)):
+                    for i, value in enumerate(fileName):
+                        condition = isinstance(value, str)
                         success = 'Check self.filename[' + str(i) + '] is str:\tOK'
-                        failure = 'Check self.filename[' + str(i) + '] is str:\tFailure, \'self.fileName[' + str(i) + '] is' + str(type(self.fileName[i]))
-                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                        failure = 'Check self.filename[' + str(i) + '] is str:\tFailure, \'self.fileName[' + str(i) + '] is' + str(type(value))
+                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                     # end self.fileName list
             # end self.fileName
 
             ## self.filePath
             # exist
-            condition = hasattr(self, 'filePath')
+            filePath = getattr(self, 'filePath', _MISSING)
+            condition = filePath is not _MISSING
             success = 'Check self.filePath exists:\tOK'
             failure = 'Check self.filePath exists:\tFailure, no attribute \'self.filePath\''
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
             if condition:
                 # is a str
-                condition = isinstance(self.filePath, (str, list))
+                condition = isinstance(filePath, (str, list))
                 success = 'Check self.filePath is a str or list:\tOK'
-                failure = 'Check self.filePath is a str or list:\tFailure, \'self.filePath\' is ' + str(type(self.filePath))
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                if isinstance(self.filePath, list):
-                    for i in range(len(self.filePath)):
-                        condition = isinstance(self.filePath[i], (str))
+                failure = 'Check self.filePath is a str or list:\tFailure, \'self.filePath\' is ' + str(type(filePath))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
+                # each element is only checked individually if the result of each check is printed or if an element is not a str
+                if isinstance(filePath, list) and (verbose or not all(isinstance(value, str) for value in filePath)):
+                    for i, value in enumerate(filePath):
+                        condition = isinstance(value, str)
                         success = 'Check self.filePath[' + str(i) + '] is str:\tOK'
-                        failure = 'Check self.filePath[' + str(i) + '] is str:\tFailure, \'self.filePath[' + str(i) + '] is' + str(type(self.filePath[i]))
-                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                        failure = 'Check self.filePath[' + str(i) + '] is str:\tFailure, \'self.filePath[' + str(i) + '] is' + str(type(value))
+                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                     # end self.filePath list
             # end self.filePath
 
             ## self._intensityData
             # Use _intensityData as size reference for all future tables
-            if (self._intensityData.all() != numpy.array(None).all()):
+            if self._intensityData.shape != ():
                 refNumSamples = self._intensityData.shape[0]
                 refNumFeatures = self._intensityData.shape[1]
                 if verbose:
@@ -2405,209 +2362,153 @@ class TargetedDataset(Dataset):
 
             ## self.sampleMetadata
             # number of samples
-            condition = (self.sampleMetadata.shape[0] == refNumSamples)
+            condition = (sampleMetadata.shape[0] == refNumSamples)
             success = 'Check self.sampleMetadata number of samples (rows):\tOK'
-            failure = 'Check self.sampleMetadata number of samples (rows):\tFailure, \'self.sampleMetadata\' has ' + str(self.sampleMetadata.shape[0]) + ' samples, ' + str(refNumSamples) + 'expected'
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+            failure = 'Check self.sampleMetadata number of samples (rows):\tFailure, \'self.sampleMetadata\' has ' + str(sampleMetadata.shape[0]) + ' samples, ' + str(refNumSamples) + 'expected'
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
             if condition:
-                # sampleMetadata['Sample File Name'] is str
-                condition = isinstance(self.sampleMetadata['Sample File Name'][0], str)
-                success = 'Check self.sampleMetadata[\'Sample File Name\'] is str:\tOK'
-                failure = 'Check self.sampleMetadata[\'Sample File Name\'] is str:\tFailure, \'self.sampleMetadata[\'Sample File Name\']\' is ' + str(type(self.sampleMetadata['Sample File Name'][0]))
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-
-                ## Fields required for QC
-                # sampleMetadata['AssayRole'] is enum AssayRole
-                condition = isinstance(self.sampleMetadata['AssayRole'][0], AssayRole)
-                success = 'Check self.sampleMetadata[\'AssayRole\'] is an enum \'AssayRole\':\tOK'
-                failure = 'Check self.sampleMetadata[\'AssayRole\'] is an enum \'AssayRole\':\tFailure, \'self.sampleMetadata[\'AssayRole\']\' is ' + str(type(self.sampleMetadata['AssayRole'][0]))
-                failureListQC = conditionTest(condition, success, failure, failureListQC, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # sampleMetadata['SampleType'] is enum SampleType
-                condition = isinstance(self.sampleMetadata['SampleType'][0], SampleType)
-                success = 'Check self.sampleMetadata[\'SampleType\'] is an enum \'SampleType\':\tOK'
-                failure = 'Check self.sampleMetadata[\'SampleType\'] is an enum \'SampleType\':\tFailure, \'self.sampleMetadata[\'SampleType\']\' is ' + str(type(self.sampleMetadata['SampleType'][0]))
-                failureListQC = conditionTest(condition, success, failure, failureListQC, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # sampleMetadata['Dilution'] is an int or float
-                condition = isinstance(self.sampleMetadata['Dilution'][0], (int, float, numpy.integer, numpy.floating))
-                success = 'Check self.sampleMetadata[\'Dilution\'] is int or float:\tOK'
-                failure = 'Check self.sampleMetadata[\'Dilution\'] is int or float:\tFailure, \'self.sampleMetadata[\'Dilution\']\' is ' + str(type(self.sampleMetadata['Dilution'][0]))
-                failureListQC = conditionTest(condition, success, failure, failureListQC, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # sampleMetadata['Batch'] is an int or float
-                condition = isinstance(self.sampleMetadata['Batch'][0], (int, float, numpy.integer, numpy.floating))
-                success = 'Check self.sampleMetadata[\'Batch\'] is int or float:\tOK'
-                failure = 'Check self.sampleMetadata[\'Batch\'] is int or float:\tFailure, \'self.sampleMetadata[\'Batch\']\' is ' + str(type(self.sampleMetadata['Batch'][0]))
-                failureListQC = conditionTest(condition, success, failure, failureListQC, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # sampleMetadata['Correction Batch'] is an int or float
-                condition = isinstance(self.sampleMetadata['Correction Batch'][0], (int, float, numpy.integer, numpy.floating))
-                success = 'Check self.sampleMetadata[\'Correction Batch\'] is int or float:\tOK'
-                failure = 'Check self.sampleMetadata[\'Correction Batch\'] is int or float:\tFailure, \'self.sampleMetadata[\'Correction Batch\']\' is ' + str(type(self.sampleMetadata['Correction Batch'][0]))
-                failureListQC = conditionTest(condition, success, failure, failureListQC, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # sampleMetadata['Run Order'] is an int
-                condition = isinstance(self.sampleMetadata['Run Order'][0], (int, numpy.integer))
-                success = 'Check self.sampleMetadata[\'Run Order\'] is int:\tOK'
-                failure = 'Check self.sampleMetadata[\'Run Order\'] is int:\tFailure, \'self.sampleMetadata[\'Run Order\']\' is ' + str(type(self.sampleMetadata['Run Order'][0]))
-                failureListQC = conditionTest(condition, success, failure, failureListQC, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # sampleMetadata['Acquired Time'] is datetime.datetime
-                condition = isinstance(self.sampleMetadata['Acquired Time'][0], datetime)
-                success = 'Check self.sampleMetadata[\'Acquired Time\'] is datetime:\tOK'
-                failure = 'Check self.sampleMetadata[\'Acquired Time\'] is datetime:\tFailure, \'self.sampleMetadata[\'Acquired Time\']\' is ' + str(type(self.sampleMetadata['Acquired Time'][0]))
-                failureListQC = conditionTest(condition, success, failure, failureListQC, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # sampleMetadata['Sample Base Name'] is str
-                condition = isinstance(self.sampleMetadata['Sample Base Name'][0], str)
-                success = 'Check self.sampleMetadata[\'Sample Base Name\'] is str:\tOK'
-                failure = 'Check self.sampleMetadata[\'Sample Base Name\'] is str:\tFailure, \'self.sampleMetadata[\'Sample Base Name\']\' is ' + str(type(self.sampleMetadata['Sample Base Name'][0]))
-                failureListQC = conditionTest(condition, success, failure, failureListQC, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                # sampleMetadata columns required for basic and QC use, see _sampleMetadataSchema
+                failureListByName = {'Basic': failureListBasic, 'QC': failureListQC}
+                for column, columnType, description, listName in _sampleMetadataSchema:
+                    valueType = _columnValueType(sampleMetadata[column])
+                    condition = issubclass(valueType, columnType)
+                    success = 'Check self.sampleMetadata[\'' + column + '\'] ' + description + ':\tOK'
+                    failure = 'Check self.sampleMetadata[\'' + column + '\'] ' + description + ':\tFailure, \'self.sampleMetadata[\'' + column + '\']\' is ' + str(valueType)
+                    conditionTest(condition, success, failure, failureListByName[listName], verbose, raiseError, raiseWarning, exception=TypeError)
 
                 ## Sample metadata fields
                 # ['Subject ID']
-                condition = ('Subject ID' in self.sampleMetadata.columns)
+                condition = ('Subject ID' in sampleMetadata.columns)
                 success = 'Check self.sampleMetadata[\'Subject ID\'] exists:\tOK'
                 failure = 'Check self.sampleMetadata[\'Subject ID\'] exists:\tFailure, \'self.sampleMetadata\' lacks a \'Subject ID\' column'
-                failureListMeta = conditionTest(condition, success, failure, failureListMeta, verbose, raiseError, raiseWarning, exception=LookupError(failure))
+                failureListMeta = conditionTest(condition, success, failure, failureListMeta, verbose, raiseError, raiseWarning, exception=LookupError)
                 if condition:
                     # sampleMetadata['Subject ID'] is str
-                    condition = (self.sampleMetadata['Subject ID'].dtype == numpy.dtype('O'))
+                    condition = (sampleMetadata['Subject ID'].dtype == numpy.dtype('O'))
                     success = 'Check self.sampleMetadata[\'Subject ID\'] is str:\tOK'
-                    failure = 'Check self.sampleMetadata[\'Subject ID\'] is str:\tFailure, \'self.sampleMetadata[\'Subject ID\']\' is ' + str(type(self.sampleMetadata['Subject ID'][0]))
-                    failureListMeta = conditionTest(condition, success, failure, failureListMeta, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                    failure = lambda: 'Check self.sampleMetadata[\'Subject ID\'] is str:\tFailure, \'self.sampleMetadata[\'Subject ID\']\' is ' + str(_columnValueType(sampleMetadata['Subject ID']))
+                    failureListMeta = conditionTest(condition, success, failure, failureListMeta, verbose, raiseError, raiseWarning, exception=TypeError)
                 # end self.sampleMetadata['Subject ID']
                 # sampleMetadata['Sample ID'] is str
-                condition = (self.sampleMetadata['Sample ID'].dtype == numpy.dtype('O'))
+                condition = (sampleMetadata['Sample ID'].dtype == numpy.dtype('O'))
                 success = 'Check self.sampleMetadata[\'Sample ID\'] is str:\tOK'
-                failure = 'Check self.sampleMetadata[\'Sample ID\'] is str:\tFailure, \'self.sampleMetadata[\'Sample ID\']\' is ' + str(type(self.sampleMetadata['Sample ID'][0]))
-                failureListMeta = conditionTest(condition, success, failure, failureListMeta, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                failure = lambda: 'Check self.sampleMetadata[\'Sample ID\'] is str:\tFailure, \'self.sampleMetadata[\'Sample ID\']\' is ' + str(_columnValueType(sampleMetadata['Sample ID']))
+                failureListMeta = conditionTest(condition, success, failure, failureListMeta, verbose, raiseError, raiseWarning, exception=TypeError)
             # end self.sampleMetadata number of samples
             # end self.sampleMetadata
 
             ## self.featureMetadata
             # exist
             # number of features
-            condition = (self.featureMetadata.shape[0] == refNumFeatures)
+            condition = (featureMetadata.shape[0] == refNumFeatures)
             success = 'Check self.featureMetadata number of features (rows):\tOK'
-            failure = 'Check self.featureMetadata number of features (rows):\tFailure, \'self.featureMetadata\' has ' + str(self.featureMetadata.shape[0]) + ' features, ' + str(refNumFeatures) + ' expected'
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
-            if condition & (self.featureMetadata.shape[0] != 0):
+            failure = 'Check self.featureMetadata number of features (rows):\tFailure, \'self.featureMetadata\' has ' + str(featureMetadata.shape[0]) + ' features, ' + str(refNumFeatures) + ' expected'
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
+            if condition & (featureMetadata.shape[0] != 0):
                 # No point checking columns if the number of columns is wrong or no features
                 # featureMetadata['Feature Name'] is str
-                condition = isinstance(self.featureMetadata['Feature Name'][0], str)
+                condition = issubclass(_columnValueType(featureMetadata['Feature Name']), str)
                 success = 'Check self.featureMetadata[\'Feature Name\'] is str:\tOK'
-                failure = 'Check self.featureMetadata[\'Feature Name\'] is str:\tFailure, \'self.featureMetadata[\'Feature Name\']\' is ' + str(type(self.featureMetadata['Feature Name'][0]))
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                failure = lambda: 'Check self.featureMetadata[\'Feature Name\'] is str:\tFailure, \'self.featureMetadata[\'Feature Name\']\' is ' + str(_columnValueType(featureMetadata['Feature Name']))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                 if condition:
                     # featureMetadata['Feature Name'] are unique
-                    u_ids, u_counts = numpy.unique(self.featureMetadata['Feature Name'], return_counts=True)
-                    condition = all(u_counts == 1)
+                    duplicatedFeatureName = featureMetadata['Feature Name'].duplicated()
+                    condition = not duplicatedFeatureName.any()
                     success = 'Check self.featureMetadata[\'Feature Name\'] are unique:\tOK'
-                    failure = 'Check self.featureMetadata[\'Feature Name\'] are unique:\tFailure, the following \'self.featureMetadata[\'Feature Name\']\' are present more than once ' + str(u_ids[u_counts > 1].tolist())
-                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                    failure = lambda: 'Check self.featureMetadata[\'Feature Name\'] are unique:\tFailure, the following \'self.featureMetadata[\'Feature Name\']\' are present more than once ' + str(sorted(featureMetadata['Feature Name'][duplicatedFeatureName].unique().tolist()))
+                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                     # Use featureMetadata['Feature Name'] as reference for future tables
-                    refFeatureName = self.featureMetadata['Feature Name'].values.tolist()
+                    refFeatureName = featureMetadata['Feature Name'].values.tolist()
                     if verbose:
                         print('---- self.featureMetadata[\'Feature Name\'] used as Feature Name reference ----')
                 # end self.featureMetadata['Feature Name']
-                # ['calibrationMethod']
-                condition = ('calibrationMethod' in self.featureMetadata.columns)
-                success = 'Check self.featureMetadata[\'calibrationMethod\'] exists:\tOK'
-                failure = 'Check self.featureMetadata[\'calibrationMethod\'] exists:\tFailure, \'self.featureMetadata\' lacks a \'calibrationMethod\' column'
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError(failure))
-                if condition:
-                    # featureMetadata['calibrationMethod'] is an enum 'CalibrationMethod'
-                    condition = isinstance(self.featureMetadata['calibrationMethod'][0], CalibrationMethod)
-                    success = 'Check self.featureMetadata[\'calibrationMethod\'] is an enum \'CalibrationMethod\':\tOK'
-                    failure = 'Check self.featureMetadata[\'calibrationMethod\'] is an enum \'CalibrationMethod\':\tFailure, \'self.featureMetadata[\'calibrationMethod\']\' is ' + str(type(self.featureMetadata['calibrationMethod'][0]))
-                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # end self.featureMetadata['calibrationMethod']
-                # ['quantificationType']
-                condition = ('quantificationType' in self.featureMetadata.columns)
-                success = 'Check self.featureMetadata[\'quantificationType\'] exists:\tOK'
-                failure = 'Check self.featureMetadata[\'quantificationType\'] exists:\tFailure, \'self.featureMetadata\' lacks a \'quantificationType\' column'
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError(failure))
-                if condition:
-                    # featureMetadata['quantificationType'] is an enum 'QuantificationType'
-                    condition = isinstance(self.featureMetadata['quantificationType'][0], QuantificationType)
-                    success = 'Check self.featureMetadata[\'quantificationType\'] is an enum \'QuantificationType\':\tOK'
-                    failure = 'Check self.featureMetadata[\'quantificationType\'] is an enum \'QuantificationType\':\tFailure, \'self.featureMetadata[\'quantificationType\']\' is ' + str(type(self.featureMetadata['quantificationType'][0]))
-                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # end self.featureMetadata['quantificationType']
-                # ['Unit']
-                condition = ('Unit' in self.featureMetadata.columns)
-                success = 'Check self.featureMetadata[\'Unit\'] exists:\tOK'
-                failure = 'Check self.featureMetadata[\'Unit\'] exists:\tFailure, \'self.featureMetadata\' lacks a \'Unit\' column'
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError(failure))
-                if condition:
-                    # featureMetadata['Unit'] is a str
-                    condition = isinstance(self.featureMetadata['Unit'][0], str)
-                    success = 'Check self.featureMetadata[\'Unit\'] is a str:\tOK'
-                    failure = 'Check self.featureMetadata[\'Unit\'] is a str:\tFailure, \'self.featureMetadata[\'Unit\']\' is ' + str(type(self.featureMetadata['Unit'][0]))
-                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
-                # end self.featureMetadata['Unit']
+                # featureMetadata columns, see _featureMetadataSchema
+                for column, columnType, description in _featureMetadataSchema:
+                    # exist
+                    condition = (column in featureMetadata.columns)
+                    success = 'Check self.featureMetadata[\'' + column + '\'] exists:\tOK'
+                    failure = 'Check self.featureMetadata[\'' + column + '\'] exists:\tFailure, \'self.featureMetadata\' lacks a \'' + column + '\' column'
+                    conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError)
+                    if condition:
+                        # is of the expected type
+                        valueType = _columnValueType(featureMetadata[column])
+                        condition = issubclass(valueType, columnType)
+                        success = 'Check self.featureMetadata[\'' + column + '\'] ' + description + ':\tOK'
+                        failure = 'Check self.featureMetadata[\'' + column + '\'] ' + description + ':\tFailure, \'self.featureMetadata[\'' + column + '\']\' is ' + str(valueType)
+                        conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
+                # end featureMetadata columns
                 # ['LLOQ']
-                tmpLLOQMatch = self.featureMetadata.columns.to_series().str.contains('LLOQ')
+                tmpLLOQMatch = featureMetadata.columns.to_series().str.contains('LLOQ')
                 condition = (sum(tmpLLOQMatch) > 0)
                 success = 'Check self.featureMetadata[\'LLOQ\'] or similar exists:\tOK'
                 failure = 'Check self.featureMetadata[\'LLOQ\'] or similar exists:\tFailure, \'self.featureMetadata\' lacks a \'LLOQ\' or \'LLOQ_batch\' column'
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError(failure))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError)
                 if condition:
                     # featureMetadata['LLOQ'] is a float, try on first found
-                    condition = ((self.featureMetadata.loc[:, tmpLLOQMatch].iloc[:, 0].dtype == numpy.dtype(numpy.float)) | (self.featureMetadata.loc[:, tmpLLOQMatch].iloc[:, 0].dtype == numpy.dtype(numpy.int32)) | (self.featureMetadata.loc[:, tmpLLOQMatch].iloc[:, 0].dtype == numpy.dtype(numpy.int64)))
-                    success = 'Check self.featureMetadata[\'' + str(self.featureMetadata.columns[tmpLLOQMatch][0]) + '\'] is int or float:\tOK'
-                    failure = 'Check self.featureMetadata[\'' + str(self.featureMetadata.columns[tmpLLOQMatch][0]) + '\'] is int or float:\tFailure, \'self.featureMetadata[\'' + str(self.featureMetadata.columns[tmpLLOQMatch][0]) + '\']\' is ' + str(self.featureMetadata.loc[:, tmpLLOQMatch].iloc[:, 0].dtype)
-                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                    loqColumn = featureMetadata.columns[tmpLLOQMatch][0]
+                    loqDtype = featureMetadata.loc[:, tmpLLOQMatch].iloc[:, 0].dtype
+                    condition = ((loqDtype == numpy.dtype(numpy.float)) | (loqDtype == numpy.dtype(numpy.int32)) | (loqDtype == numpy.dtype(numpy.int64)))
+                    success = 'Check self.featureMetadata[\'' + str(loqColumn) + '\'] is int or float:\tOK'
+                    failure = 'Check self.featureMetadata[\'' + str(loqColumn) + '\'] is int or float:\tFailure, \'self.featureMetadata[\'' + str(loqColumn) + '\']\' is ' + str(loqDtype)
+                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                 # end self.featureMetadata['LLOQ']
                 # ['ULOQ']
-                tmpULOQMatch = self.featureMetadata.columns.to_series().str.contains('ULOQ')
+                tmpULOQMatch = featureMetadata.columns.to_series().str.contains('ULOQ')
                 condition = (sum(tmpULOQMatch) > 0)
                 success = 'Check self.featureMetadata[\'ULOQ\'] or similar exists:\tOK'
                 failure = 'Check self.featureMetadata[\'ULOQ\'] or similar exists:\tFailure, \'self.featureMetadata\' lacks a \'ULOQ\' or \'ULOQ_batch\' column'
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError(failure))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError)
                 if condition:
                     # featureMetadata['ULOQ'] is a float, try on first found
-                    condition = ((self.featureMetadata.loc[:, tmpULOQMatch].iloc[:, 0].dtype == numpy.dtype(numpy.float)) | (self.featureMetadata.loc[:, tmpULOQMatch].iloc[:, 0].dtype == numpy.dtype(numpy.int32)) | (self.featureMetadata.loc[:, tmpULOQMatch].iloc[:, 0].dtype == numpy.dtype(numpy.int64)))
-                    success = 'Check self.featureMetadata[\'' + str(self.featureMetadata.columns[tmpULOQMatch][0]) + '\'] is int or float:\tOK'
-                    failure = 'Check self.featureMetadata[\'' + str(self.featureMetadata.columns[tmpULOQMatch][0]) + '\'] is int or float:\tFailure, \'self.featureMetadata[\'' + str(self.featureMetadata.columns[tmpULOQMatch][0]) + '\']\' is ' + str(self.featureMetadata.loc[:, tmpULOQMatch].iloc[:, 0].dtype)
-                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                    loqColumn = featureMetadata.columns[tmpULOQMatch][0]
+                    loqDtype = featureMetadata.loc[:, tmpULOQMatch].iloc[:, 0].dtype
+                    condition = ((loqDtype == numpy.dtype(numpy.float)) | (loqDtype == numpy.dtype(numpy.int32)) | (loqDtype == numpy.dtype(numpy.int64)))
+                    success = 'Check self.featureMetadata[\'' + str(loqColumn) + '\'] is int or float:\tOK'
+                    failure = 'Check self.featureMetadata[\'' + str(loqColumn) + '\'] is int or float:\tFailure, \'self.featureMetadata[\'' + str(loqColumn) + '\']\' is ' + str(loqDtype)
+                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                 # end self.featureMetadata['ULOQ']
                 # 'externalID' in featureMetadata columns (need externalID to exist)
-                if 'externalID' in self.Attributes:
-                    if isinstance(self.Attributes['externalID'], list):
-                        condition = set(self.Attributes['externalID']).issubset(self.featureMetadata.columns)
+                if 'externalID' in attributes:
+                    if isinstance(attributes['externalID'], list):
+                        condition = set(attributes['externalID']).issubset(featureMetadata.columns)
                         success = 'Check self.featureMetadata does have the \'externalID\' as columns:\tOK'
                         failure = 'Check self.featureMetadata does have the \'externalID\' as columns:\tFailure, \'self.featureMetadata\' lacks the \'externalID\' columns'
-                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError(failure))
+                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError)
                 # end 'externalID' columns
             # end self.featureMetadata number of features
             # end self.featureMetadata
 
             ## self.expectedConcentration
             # exist
-            condition = hasattr(self, 'expectedConcentration')
+            expectedConcentration = getattr(self, 'expectedConcentration', _MISSING)
+            condition = expectedConcentration is not _MISSING
             success = 'Check self.expectedConcentration exists:\tOK'
             failure = 'Check self.expectedConcentration exists:\tFailure, no attribute \'self.expectedConcentration\''
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
             if condition:
                 # is a pandas.DataFrame
-                condition = isinstance(self.expectedConcentration, pandas.DataFrame)
+                condition = isinstance(expectedConcentration, pandas.DataFrame)
                 success = 'Check self.expectedConcentration is a pandas.DataFrame:\tOK'
-                failure = 'Check self.expectedConcentration is a pandas.DataFrame:\tFailure, \'self.expectedConcentration\' is ' + str(type(self.expectedConcentration))
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                failure = 'Check self.expectedConcentration is a pandas.DataFrame:\tFailure, \'self.expectedConcentration\' is ' + str(type(expectedConcentration))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                 if condition:
                     # number of samples
-                    condition = (self.expectedConcentration.shape[0] == refNumSamples)
+                    condition = (expectedConcentration.shape[0] == refNumSamples)
                     success = 'Check self.expectedConcentration number of samples (rows):\tOK'
-                    failure = 'Check self.expectedConcentration number of samples (rows):\tFailure, \'self.expectedConcentration\' has ' + str(self.expectedConcentration.shape[0]) + ' features, ' + str(refNumSamples) + ' expected'
-                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                    failure = 'Check self.expectedConcentration number of samples (rows):\tFailure, \'self.expectedConcentration\' has ' + str(expectedConcentration.shape[0]) + ' features, ' + str(refNumSamples) + ' expected'
+                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                     # number of features
-                    condition = (self.expectedConcentration.shape[1] == refNumFeatures)
+                    condition = (expectedConcentration.shape[1] == refNumFeatures)
                     success = 'Check self.expectedConcentration number of features (columns):\tOK'
-                    failure = 'Check self.expectedConcentration number of features (columns):\tFailure, \'self.expectedConcentration\' has ' + str(self.expectedConcentration.shape[1]) + ' features, ' + str(refNumFeatures) + ' expected'
-                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                    failure = 'Check self.expectedConcentration number of features (columns):\tFailure, \'self.expectedConcentration\' has ' + str(expectedConcentration.shape[1]) + ' features, ' + str(refNumFeatures) + ' expected'
+                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                     if condition & (refNumFeatures != 0):
                         # expectedConcentration column names match ['Feature Name']
-                        tmpDiff = pandas.DataFrame({'FeatName': refFeatureName, 'ColName': self.expectedConcentration.columns.values.tolist()})
-                        condition = (self.expectedConcentration.columns.values.tolist() == refFeatureName)
+                        condition = (expectedConcentration.columns.values.tolist() == refFeatureName)
                         success = 'Check self.expectedConcentration column name match self.featureMetadata[\'Feature Name\']:\tOK'
-                        failure = 'Check self.expectedConcentration column name match self.featureMetadata[\'Feature Name\']:\tFailure, the following \'self.featureMetadata[\'Feature Name\']\' and \'self.expectedConcentration.columns\' differ ' + str(tmpDiff.loc[(tmpDiff['FeatName'] != tmpDiff['ColName']), ['FeatName', 'ColName']].values.tolist())
-                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                        failure = lambda: 'Check self.expectedConcentration column name match self.featureMetadata[\'Feature Name\']:\tFailure, the following \'self.featureMetadata[\'Feature Name\']\' and \'self.expectedConcentration.columns\' differ ' + str(_namesDifference(refFeatureName, expectedConcentration.columns.values.tolist()))
+                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                     # end self.expectedConcentration number of features
                 # end self.expectedConcentration is a pandas.DataFrame
             # end self.expectedConcentration
@@ -2617,13 +2518,13 @@ class TargetedDataset(Dataset):
             condition = (self.sampleMask.shape != ())
             success = 'Check self.sampleMask is initialised:\tOK'
             failure = 'Check self.sampleMask is initialised:\tFailure, \'self.sampleMask\' is not initialised'
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose,raiseError, raiseWarning, exception=ValueError(failure))
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose,raiseError, raiseWarning, exception=ValueError)
             if condition:
                 # number of samples
                 condition = (self.sampleMask.shape == (refNumSamples,))
                 success = 'Check self.sampleMask number of samples:\tOK'
                 failure = 'Check self.sampleMask number of samples:\tFailure, \'self.sampleMask\' has ' + str(self.sampleMask.shape[0]) + ' samples, ' + str(refNumSamples) + ' expected'
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
             ## end self.sampleMask
 
             ## self.featureMask
@@ -2631,58 +2532,59 @@ class TargetedDataset(Dataset):
             condition = (self.featureMask.shape != ())
             success = 'Check self.featureMask is initialised:\tOK'
             failure = 'Check self.featureMask is initialised:\tFailure, \'self.featureMask\' is not initialised'
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
             if condition:
                 # number of features
                 condition = (self.featureMask.shape == (refNumFeatures,))
                 success = 'Check self.featureMask number of features:\tOK'
                 failure = 'Check self.featureMask number of features:\tFailure, \'self.featureMask\' has ' + str(self.featureMask.shape[0]) + ' features, ' + str(refNumFeatures) + ' expected'
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
             ## end self.featureMask
 
             ## self.calibration
             # exist
-            condition = hasattr(self, 'calibration')
+            calibration = getattr(self, 'calibration', _MISSING)
+            condition = calibration is not _MISSING
             success = 'Check self.calibration exists:\tOK'
             failure = 'Check self.calibration exists:\tFailure, no attribute \'self.calibration\''
-            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
             if condition:
                 # is a dict or a list
-                condition = isinstance(self.calibration, (dict, list))
+                condition = isinstance(calibration, (dict, list))
                 success = 'Check self.calibration is a dict or list:\tOK'
-                failure = 'Check self.calibration is a dict or list:\tFailure, \'self.calibration\' is ' + str(type(self.calibration))
-                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                failure = 'Check self.calibration is a dict or list:\tFailure, \'self.calibration\' is ' + str(type(calibration))
+                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                 if condition:
                     # self.calibration is a list of dict
-                    if isinstance(self.calibration, list):
+                    if isinstance(calibration, list):
                         # use reference inside each calibration
-                        refCalibNumSamples  = len(self.calibration) * [None]
-                        refCalibNumFeatures = len(self.calibration) * [None]
-                        refCalibFeatureName = len(self.calibration) * [None]
-                        for i in range(len(self.calibration)):
+                        refCalibNumSamples  = len(calibration) * [None]
+                        refCalibNumFeatures = len(calibration) * [None]
+                        refCalibFeatureName = len(calibration) * [None]
+                        for i in range(len(calibration)):
                             # self.calibration[i] is a dict
-                            condition = isinstance(self.calibration[i], dict)
+                            condition = isinstance(calibration[i], dict)
                             success = 'Check self.calibration[' + str(i) + '] is a dict or list:\tOK'
-                            failure = 'Check self.calibration[' + str(i) + '] is a dict or list:\tFailure, \'self.calibration\' is ' + str(type(self.calibration[i]))
-                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                            failure = 'Check self.calibration[' + str(i) + '] is a dict or list:\tFailure, \'self.calibration\' is ' + str(type(calibration[i]))
+                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                             if condition:
                                 ## calibIntensityData
                                 # exist
-                                condition = 'calibIntensityData' in self.calibration[i]
+                                condition = 'calibIntensityData' in calibration[i]
                                 success = 'Check self.calibration[' + str(i) + '][\'calibIntensityData\'] exists:\tOK'
                                 failure = 'Check self.calibration[' + str(i) + '][\'calibIntensityData\'] exists:\tFailure, no attribute \'self.calibration[' + str(i) + '][\'calibIntensityData\']\''
-                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
                                 if condition:
                                     # is a numpy.ndarray
-                                    condition = isinstance(self.calibration[i]['calibIntensityData'], numpy.ndarray)
+                                    condition = isinstance(calibration[i]['calibIntensityData'], numpy.ndarray)
                                     success = 'Check self.calibration[' + str(i) + '][\'calibIntensityData\'] is a numpy.ndarray:\tOK'
-                                    failure = 'Check self.calibration[' + str(i) + '][\'calibIntensityData\'] is a numpy.ndarray:\tFailure, \'self.calibration[' + str(i) + '][\'calibIntensityData\']\' is ' + str(type(self.calibration[i]['calibIntensityData']))
-                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                                    failure = 'Check self.calibration[' + str(i) + '][\'calibIntensityData\'] is a numpy.ndarray:\tFailure, \'self.calibration[' + str(i) + '][\'calibIntensityData\']\' is ' + str(type(calibration[i]['calibIntensityData']))
+                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                                     if condition:
-                                        if (self.calibration[i]['calibIntensityData'].all() != numpy.array(None).all()):
+                                        if calibration[i]['calibIntensityData'].shape != ():
                                             # Use calibIntensityData as number of calib sample/feature reference
-                                            refCalibNumSamples[i] = self.calibration[i]['calibIntensityData'].shape[0]
-                                            refCalibNumFeatures[i] = self.calibration[i]['calibIntensityData'].shape[1]
+                                            refCalibNumSamples[i] = calibration[i]['calibIntensityData'].shape[0]
+                                            refCalibNumFeatures[i] = calibration[i]['calibIntensityData'].shape[1]
                                             if verbose:
                                                 print('---- self.calibration[' + str(i) + '][\'calibIntensityData\'] used as number of calibration samples/features reference ----')
                                                 print('\t' + str(refCalibNumSamples[i]) + ' samples, ' + str(refCalibNumFeatures[i]) + ' features')
@@ -2690,83 +2592,82 @@ class TargetedDataset(Dataset):
                                 # end calibIntensityData
                                 ## calibSampleMetadata
                                 # exist
-                                condition = 'calibSampleMetadata' in self.calibration[i]
+                                condition = 'calibSampleMetadata' in calibration[i]
                                 success = 'Check self.calibration[' + str(i) + '][\'calibSampleMetadata\'] exists:\tOK'
                                 failure = 'Check self.calibration[' + str(i) + '][\'calibSampleMetadata\'] exists:\tFailure, no attribute \'self.calibration[' + str(i) + '][\'calibSampleMetadata\']\''
-                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
                                 if condition:
                                     # is a pandas.DataFrame
-                                    condition = isinstance(self.calibration[i]['calibSampleMetadata'], pandas.DataFrame)
+                                    condition = isinstance(calibration[i]['calibSampleMetadata'], pandas.DataFrame)
                                     success = 'Check self.calibration[' + str(i) + '][\'calibSampleMetadata\'] is a pandas.DataFrame:\tOK'
-                                    failure = 'Check self.calibration[' + str(i) + '][\'calibSampleMetadata\'] is a pandas.DataFrame:\tFailure, \'self.calibration[' + str(i) + '][\'calibSampleMetadata\']\' is ' + str(type(self.calibration[i]['calibSampleMetadata']))
-                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                                    failure = 'Check self.calibration[' + str(i) + '][\'calibSampleMetadata\'] is a pandas.DataFrame:\tFailure, \'self.calibration[' + str(i) + '][\'calibSampleMetadata\']\' is ' + str(type(calibration[i]['calibSampleMetadata']))
+                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                                     if condition:
                                         # number of samples
-                                        condition = (self.calibration[i]['calibSampleMetadata'].shape[0] == refCalibNumSamples[i])
+                                        condition = (calibration[i]['calibSampleMetadata'].shape[0] == refCalibNumSamples[i])
                                         success = 'Check self.calibration[' + str(i) + '][\'calibSampleMetadata\'] number of samples:\tOK'
-                                        failure = 'Check self.calibration[' + str(i) + '][\'calibSampleMetadata\'] number of samples:\tFailure, \'self.calibration[' + str(i) + '][\'calibSampleMetadata\']\' has ' + str(self.calibration[i]['calibSampleMetadata'].shape[0]) + ' samples, ' + str(refCalibNumSamples[i]) + ' expected'
-                                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                        failure = 'Check self.calibration[' + str(i) + '][\'calibSampleMetadata\'] number of samples:\tFailure, \'self.calibration[' + str(i) + '][\'calibSampleMetadata\']\' has ' + str(calibration[i]['calibSampleMetadata'].shape[0]) + ' samples, ' + str(refCalibNumSamples[i]) + ' expected'
+                                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                     # end calibSampleMetadata is a pandas.DataFrame
                                 # end calibSampleMetadata
                                 ## calibFeatureMetadata
                                 # exist
-                                condition = 'calibFeatureMetadata' in self.calibration[i]
+                                condition = 'calibFeatureMetadata' in calibration[i]
                                 success = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'] exists:\tOK'
                                 failure = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'] exists:\tFailure, no attribute \'self.calibration[' + str(i) + '][\'calibFeatureMetadata\']\''
-                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
                                 if condition:
                                     # is a pandas.DataFrame
-                                    condition = isinstance(self.calibration[i]['calibFeatureMetadata'], pandas.DataFrame)
+                                    condition = isinstance(calibration[i]['calibFeatureMetadata'], pandas.DataFrame)
                                     success = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'] is a pandas.DataFrame:\tOK'
-                                    failure = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'] is a pandas.DataFrame:\tFailure, \'self.calibration[' + str(i) + '][\'calibFeatureMetadata\']\' is ' + str(type(self.calibration[i]['calibFeatureMetadata']))
-                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                                    failure = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'] is a pandas.DataFrame:\tFailure, \'self.calibration[' + str(i) + '][\'calibFeatureMetadata\']\' is ' + str(type(calibration[i]['calibFeatureMetadata']))
+                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                                     if condition:
                                         # number of features
-                                        condition = (self.calibration[i]['calibFeatureMetadata'].shape[0] == refCalibNumFeatures[i])
+                                        condition = (calibration[i]['calibFeatureMetadata'].shape[0] == refCalibNumFeatures[i])
                                         success = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'] number of features:\tOK'
-                                        failure = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'] number of features:\tFailure, \'self.calibration[' + str(i) + '][\'calibFeatureMetadata\']\' has ' + str(self.calibration[i]['calibFeatureMetadata'].shape[0]) + ' features, ' + str(refCalibNumFeatures[i]) + ' expected'
-                                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                        failure = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'] number of features:\tFailure, \'self.calibration[' + str(i) + '][\'calibFeatureMetadata\']\' has ' + str(calibration[i]['calibFeatureMetadata'].shape[0]) + ' features, ' + str(refCalibNumFeatures[i]) + ' expected'
+                                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                         if condition & (refCalibNumFeatures[i] != 0):
                                             # Feature Name exist
-                                            condition = ('Feature Name' in self.calibration[i]['calibFeatureMetadata'].columns.tolist())
+                                            condition = ('Feature Name' in calibration[i]['calibFeatureMetadata'].columns.tolist())
                                             success = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'][\'Feature Name\'] exist:\tOK'
                                             failure = 'Check self.calibration[' + str(i) + '][\'calibFeatureMetadata\'][\'Feature Name\'] exist:\tFailure, no column \'self.calibration[' + str(i) + '][\'calibFeatureMetadata\'][\'Feature Name\']'
-                                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose,raiseError, raiseWarning, exception=LookupError(failure))
+                                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose,raiseError, raiseWarning, exception=LookupError)
                                             if condition:
                                                 # store the featureMetadata columns as reference
-                                                refCalibFeatureName[i] = self.calibration[i]['calibFeatureMetadata']['Feature Name'].values.tolist()
+                                                refCalibFeatureName[i] = calibration[i]['calibFeatureMetadata']['Feature Name'].values.tolist()
                                     # end calibFeatureMetadata is a pandas.DataFrame
                                 # end calibFeatureMetadata
                                 ## calibExpectedConcentration
                                 # exist
-                                condition = 'calibExpectedConcentration' in self.calibration[i]
+                                condition = 'calibExpectedConcentration' in calibration[i]
                                 success = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] exists:\tOK'
                                 failure = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] exists:\tFailure, no attribute \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\']\''
-                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
                                 if condition:
                                     # is a pandas.DataFrame
-                                    condition = isinstance(self.calibration[i]['calibExpectedConcentration'], pandas.DataFrame)
+                                    condition = isinstance(calibration[i]['calibExpectedConcentration'], pandas.DataFrame)
                                     success = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] is a pandas.DataFrame:\tOK'
-                                    failure = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] is a pandas.DataFrame:\tFailure, \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\']\' is ' + str(type(self.calibration[i]['calibExpectedConcentration']))
-                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                                    failure = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] is a pandas.DataFrame:\tFailure, \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\']\' is ' + str(type(calibration[i]['calibExpectedConcentration']))
+                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                                     if condition:
                                         # number of samples
-                                        condition = (self.calibration[i]['calibExpectedConcentration'].shape[0] == refCalibNumSamples[i])
+                                        condition = (calibration[i]['calibExpectedConcentration'].shape[0] == refCalibNumSamples[i])
                                         success = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] number of samples:\tOK'
-                                        failure = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] number of samples:\tFailure, \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\']\' has ' + str(self.calibration[i]['calibExpectedConcentration'].shape[0]) + ' samples, ' + str(refCalibNumSamples[i]) + ' expected'
-                                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                        failure = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] number of samples:\tFailure, \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\']\' has ' + str(calibration[i]['calibExpectedConcentration'].shape[0]) + ' samples, ' + str(refCalibNumSamples[i]) + ' expected'
+                                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                         # number of features
-                                        condition = (self.calibration[i]['calibExpectedConcentration'].shape[1] == refCalibNumFeatures[i])
+                                        condition = (calibration[i]['calibExpectedConcentration'].shape[1] == refCalibNumFeatures[i])
                                         success = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] number of features:\tOK'
-                                        failure = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] number of features:\tFailure, \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\']\' has ' + str(self.calibration[i]['calibExpectedConcentration'].shape[1]) + ' features, ' + str(refCalibNumFeatures[i]) + ' expected'
-                                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                        failure = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] number of features:\tFailure, \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\']\' has ' + str(calibration[i]['calibExpectedConcentration'].shape[1]) + ' features, ' + str(refCalibNumFeatures[i]) + ' expected'
+                                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                         if condition & (refCalibNumFeatures[i] != 0):
                                             # calibExpectedConcentration column names match ['Feature Name']
-                                            tmpDiff = pandas.DataFrame({'FeatName': refCalibFeatureName[i],'ColName': self.calibration[i]['calibExpectedConcentration'].columns.values.tolist()})
-                                            condition = (self.calibration[i]['calibExpectedConcentration'].columns.values.tolist() == refCalibFeatureName[i])
+                                            condition = (calibration[i]['calibExpectedConcentration'].columns.values.tolist() == refCalibFeatureName[i])
                                             success = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] column name match self.calibration[' + str(i) + '][\'calibFeatureMetadata\'][\'Feature Name\']:\tOK'
-                                            failure = 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] column name match self.calibration[' + str(i) + '][\'calibFeatureMetadata\'][\'Feature Name\']:\tFailure, the following \'self.calibration[' + str(i) + '][\'calibFeatureMetadata\'][\'Feature Name\']\' and \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\'].columns\' differ ' + str(tmpDiff.loc[(tmpDiff['FeatName'] != tmpDiff['ColName']), ['FeatName','ColName']].values.tolist())
-                                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                            failure = lambda: 'Check self.calibration[' + str(i) + '][\'calibExpectedConcentration\'] column name match self.calibration[' + str(i) + '][\'calibFeatureMetadata\'][\'Feature Name\']:\tFailure, the following \'self.calibration[' + str(i) + '][\'calibFeatureMetadata\'][\'Feature Name\']\' and \'self.calibration[' + str(i) + '][\'calibExpectedConcentration\'].columns\' differ ' + str(_namesDifference(refCalibFeatureName[i], calibration[i]['calibExpectedConcentration'].columns.values.tolist()))
+                                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                         # end calibExpectedConcentration number of features
                                     # end calibExpectedConcentration is a pandas.DataFrame
                                 # end calibExpectedConcentration
@@ -2776,25 +2677,25 @@ class TargetedDataset(Dataset):
                     ## self.calibration is a dict
                         ## calibIntensityData
                         # exist
-                        condition = 'calibIntensityData' in self.calibration
+                        condition = 'calibIntensityData' in calibration
                         success = 'Check self.calibration[\'calibIntensityData\'] exists:\tOK'
                         failure = 'Check self.calibration[\'calibIntensityData\'] exists:\tFailure, no attribute \'self.calibration[\'calibIntensityData\']\''
-                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
                         if condition:
                             # is a numpy.ndarray
-                            condition = isinstance(self.calibration['calibIntensityData'], numpy.ndarray)
+                            condition = isinstance(calibration['calibIntensityData'], numpy.ndarray)
                             success = 'Check self.calibration[\'calibIntensityData\'] is a numpy.ndarray:\tOK'
-                            failure = 'Check self.calibration[\'calibIntensityData\'] is a numpy.ndarray:\tFailure, \'self.calibration[\'calibIntensityData\']\' is ' + str(type(self.calibration['calibIntensityData']))
-                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                            failure = 'Check self.calibration[\'calibIntensityData\'] is a numpy.ndarray:\tFailure, \'self.calibration[\'calibIntensityData\']\' is ' + str(type(calibration['calibIntensityData']))
+                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                             if condition:
-                                if (self.calibration['calibIntensityData'].all() != numpy.array(None).all()):
+                                if calibration['calibIntensityData'].shape != ():
                                     # number of features
-                                    condition = (self.calibration['calibIntensityData'].shape[1] == refNumFeatures)
+                                    condition = (calibration['calibIntensityData'].shape[1] == refNumFeatures)
                                     success = 'Check self.calibration[\'calibIntensityData\'] number of features:\tOK'
-                                    failure = 'Check self.calibration[\'calibIntensityData\'] number of features:\tFailure, \'self.calibration[\'calibIntensityData\']\' has ' + str(self.calibration['calibIntensityData'].shape[1]) + ' features, ' + str(refNumFeatures) + ' expected'
-                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                    failure = 'Check self.calibration[\'calibIntensityData\'] number of features:\tFailure, \'self.calibration[\'calibIntensityData\']\' has ' + str(calibration['calibIntensityData'].shape[1]) + ' features, ' + str(refNumFeatures) + ' expected'
+                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                     # Use calibIntensityData as number of calib sample reference
-                                    refNumCalibSamples = self.calibration['calibIntensityData'].shape[0]
+                                    refNumCalibSamples = calibration['calibIntensityData'].shape[0]
                                     if verbose:
                                         print('---- self.calibration[\'calibIntensityData\'] used as number of calibration samples reference ----')
                                         print('\t' + str(refNumCalibSamples) + ' samples')
@@ -2802,80 +2703,79 @@ class TargetedDataset(Dataset):
                         # end calibIntensityData
                         ## calibSampleMetadata
                         # exist
-                        condition = 'calibSampleMetadata' in self.calibration
+                        condition = 'calibSampleMetadata' in calibration
                         success = 'Check self.calibration[\'calibSampleMetadata\'] exists:\tOK'
                         failure = 'Check self.calibration[\'calibSampleMetadata\'] exists:\tFailure, no attribute \'self.calibration[\'calibSampleMetadata\']\''
-                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
                         if condition:
                             # is a pandas.DataFrame
-                            condition = isinstance(self.calibration['calibSampleMetadata'], pandas.DataFrame)
+                            condition = isinstance(calibration['calibSampleMetadata'], pandas.DataFrame)
                             success = 'Check self.calibration[\'calibSampleMetadata\'] is a pandas.DataFrame:\tOK'
-                            failure = 'Check self.calibration[\'calibSampleMetadata\'] is a pandas.DataFrame:\tFailure, \'self.calibration[\'calibSampleMetadata\']\' is ' + str(type(self.calibration['calibSampleMetadata']))
-                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                            failure = 'Check self.calibration[\'calibSampleMetadata\'] is a pandas.DataFrame:\tFailure, \'self.calibration[\'calibSampleMetadata\']\' is ' + str(type(calibration['calibSampleMetadata']))
+                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                             if condition:
                                 # number of samples
-                                condition = (self.calibration['calibSampleMetadata'].shape[0] == refNumCalibSamples)
+                                condition = (calibration['calibSampleMetadata'].shape[0] == refNumCalibSamples)
                                 success = 'Check self.calibration[\'calibSampleMetadata\'] number of samples:\tOK'
-                                failure = 'Check self.calibration[\'calibSampleMetadata\'] number of samples:\tFailure, \'self.calibration[\'calibSampleMetadata\']\' has ' + str(self.calibration['calibSampleMetadata'].shape[0]) + ' samples, ' + str(refNumCalibSamples) + ' expected'
-                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                failure = 'Check self.calibration[\'calibSampleMetadata\'] number of samples:\tFailure, \'self.calibration[\'calibSampleMetadata\']\' has ' + str(calibration['calibSampleMetadata'].shape[0]) + ' samples, ' + str(refNumCalibSamples) + ' expected'
+                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                             # end calibSampleMetadata is a pandas.DataFrame
                         # end calibSampleMetadata
                         ## calibFeatureMetadata
                         # exist
-                        condition = 'calibFeatureMetadata' in self.calibration
+                        condition = 'calibFeatureMetadata' in calibration
                         success = 'Check self.calibration[\'calibFeatureMetadata\'] exists:\tOK'
                         failure = 'Check self.calibration[\'calibFeatureMetadata\'] exists:\tFailure, no attribute \'self.calibration[\'calibFeatureMetadata\']\''
-                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
                         if condition:
                             # is a pandas.DataFrame
-                            condition = isinstance(self.calibration['calibFeatureMetadata'], pandas.DataFrame)
+                            condition = isinstance(calibration['calibFeatureMetadata'], pandas.DataFrame)
                             success = 'Check self.calibration[\'calibFeatureMetadata\'] is a pandas.DataFrame:\tOK'
-                            failure = 'Check self.calibration[\'calibFeatureMetadata\'] is a pandas.DataFrame:\tFailure, \'self.calibration[\'calibFeatureMetadata\']\' is ' + str(type(self.calibration['calibFeatureMetadata']))
-                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                            failure = 'Check self.calibration[\'calibFeatureMetadata\'] is a pandas.DataFrame:\tFailure, \'self.calibration[\'calibFeatureMetadata\']\' is ' + str(type(calibration['calibFeatureMetadata']))
+                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                             if condition:
                                 # number of features
-                                condition = (self.calibration['calibFeatureMetadata'].shape[0] == refNumFeatures)
+                                condition = (calibration['calibFeatureMetadata'].shape[0] == refNumFeatures)
                                 success = 'Check self.calibration[\'calibFeatureMetadata\'] number of features:\tOK'
-                                failure = 'Check self.calibration[\'calibFeatureMetadata\'] number of features:\tFailure, \'self.calibration[\'calibFeatureMetadata\']\' has ' + str(self.calibration['calibFeatureMetadata'].shape[0]) + ' features, ' + str(refNumFeatures) + ' expected'
-                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                failure = 'Check self.calibration[\'calibFeatureMetadata\'] number of features:\tFailure, \'self.calibration[\'calibFeatureMetadata\']\' has ' + str(calibration['calibFeatureMetadata'].shape[0]) + ' features, ' + str(refNumFeatures) + ' expected'
+                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                 if condition & (refNumFeatures != 0):
                                     # Feature Name exist
-                                    condition = ('Feature Name' in self.calibration['calibFeatureMetadata'].columns.tolist())
+                                    condition = ('Feature Name' in calibration['calibFeatureMetadata'].columns.tolist())
                                     success = 'Check self.calibration[\'calibFeatureMetadata\'][\'Feature Name\'] exist:\tOK'
                                     failure = 'Check self.calibration[\'calibFeatureMetadata\'][\'Feature Name\'] exist:\tFailure, no column \'self.calibration[\'calibFeatureMetadata\'][\'Feature Name\']'
-                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError(failure))
+                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=LookupError)
                             # end calibFeatureMetadata is a pandas.DataFrame
                         # end calibFeatureMetadata
                         ## calibExpectedConcentration
                         # exist
-                        condition = 'calibExpectedConcentration' in self.calibration
+                        condition = 'calibExpectedConcentration' in calibration
                         success = 'Check self.calibration[\'calibExpectedConcentration\'] exists:\tOK'
                         failure = 'Check self.calibration[\'calibExpectedConcentration\'] exists:\tFailure, no attribute \'self.calibration[\'calibExpectedConcentration\']\''
-                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError(failure))
+                        failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=AttributeError)
                         if condition:
                             # is a pandas.DataFrame
-                            condition = isinstance(self.calibration['calibExpectedConcentration'], pandas.DataFrame)
+                            condition = isinstance(calibration['calibExpectedConcentration'], pandas.DataFrame)
                             success = 'Check self.calibration[\'calibExpectedConcentration\'] is a pandas.DataFrame:\tOK'
-                            failure = 'Check self.calibration[\'calibExpectedConcentration\'] is a pandas.DataFrame:\tFailure, \'self.calibration[\'calibExpectedConcentration\']\' is ' + str(type(self.calibration['calibExpectedConcentration']))
-                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError(failure))
+                            failure = 'Check self.calibration[\'calibExpectedConcentration\'] is a pandas.DataFrame:\tFailure, \'self.calibration[\'calibExpectedConcentration\']\' is ' + str(type(calibration['calibExpectedConcentration']))
+                            failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=TypeError)
                             if condition:
                                 # number of samples
-                                condition = (self.calibration['calibExpectedConcentration'].shape[0] == refNumCalibSamples)
+                                condition = (calibration['calibExpectedConcentration'].shape[0] == refNumCalibSamples)
                                 success = 'Check self.calibration[\'calibExpectedConcentration\'] number of samples:\tOK'
-                                failure = 'Check self.calibration[\'calibExpectedConcentration\'] number of samples:\tFailure, \'self.calibration[\'calibExpectedConcentration\']\' has ' + str(self.calibration['calibExpectedConcentration'].shape[0]) + ' samples, ' + str(refNumCalibSamples) + ' expected'
-                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                failure = 'Check self.calibration[\'calibExpectedConcentration\'] number of samples:\tFailure, \'self.calibration[\'calibExpectedConcentration\']\' has ' + str(calibration['calibExpectedConcentration'].shape[0]) + ' samples, ' + str(refNumCalibSamples) + ' expected'
+                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                 # number of features
-                                condition = (self.calibration['calibExpectedConcentration'].shape[1] == refNumFeatures)
+                                condition = (calibration['calibExpectedConcentration'].shape[1] == refNumFeatures)
                                 success = 'Check self.calibration[\'calibExpectedConcentration\'] number of features:\tOK'
-                                failure = 'Check self.calibration[\'calibExpectedConcentration\'] number of features:\tFailure, \'self.calibration[\'calibExpectedConcentration\']\' has ' + str(self.calibration['calibExpectedConcentration'].shape[1]) + ' features, ' + str(refNumFeatures) + ' expected'
-                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                failure = 'Check self.calibration[\'calibExpectedConcentration\'] number of features:\tFailure, \'self.calibration[\'calibExpectedConcentration\']\' has ' + str(calibration['calibExpectedConcentration'].shape[1]) + ' features, ' + str(refNumFeatures) + ' expected'
+                                failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                 if condition & (refNumFeatures != 0):
                                     # calibExpectedConcentration column names match ['Feature Name']
-                                    tmpDiff = pandas.DataFrame({'FeatName': refFeatureName, 'ColName': self.calibration['calibExpectedConcentration'].columns.values.tolist()})
-                                    condition = (self.calibration['calibExpectedConcentration'].columns.values.tolist() == refFeatureName)
+                                    condition = (calibration['calibExpectedConcentration'].columns.values.tolist() == refFeatureName)
                                     success = 'Check self.calibration[\'calibExpectedConcentration\'] column name match self.featureMetadata[\'Feature Name\']:\tOK'
-                                    failure = 'Check self.calibration[\'calibExpectedConcentration\'] column name match self.featureMetadata[\'Feature Name\']:\tFailure, the following \'self.featureMetadata[\'Feature Name\']\' and \'self.calibration[\'calibExpectedConcentration\'].columns\' differ ' + str(tmpDiff.loc[(tmpDiff['FeatName'] != tmpDiff['ColName']), ['FeatName','ColName']].values.tolist())
-                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError(failure))
+                                    failure = lambda: 'Check self.calibration[\'calibExpectedConcentration\'] column name match self.featureMetadata[\'Feature Name\']:\tFailure, the following \'self.featureMetadata[\'Feature Name\']\' and \'self.calibration[\'calibExpectedConcentration\'].columns\' differ ' + str(_namesDifference(refFeatureName, calibration['calibExpectedConcentration'].columns.values.tolist()))
+                                    failureListBasic = conditionTest(condition, success, failure, failureListBasic, verbose, raiseError, raiseWarning, exception=ValueError)
                                 # end calibExpectedConcentration number of features
                             # end calibExpectedConcentration is a pandas.DataFrame
                         # end calibExpectedConcentration
@@ -2885,12 +2785,7 @@ class TargetedDataset(Dataset):
 
 
             ## List additional attributes (print + log)
-            expectedSet = set({'Attributes', 'VariableType', '_Normalisation', '_name', 'fileName', 'filePath',
-                               '_intensityData', 'sampleMetadata', 'featureMetadata', 'expectedConcentration', 'sampleMask',
-                               'featureMask', 'calibration', 'sampleMetadataExcluded', 'intensityDataExcluded',
-                               'featureMetadataExcluded', 'expectedConcentrationExcluded', 'excludedFlag'})
-            objectSet = set(self.__dict__.keys())
-            additionalAttributes = objectSet - expectedSet
+            additionalAttributes = self.__dict__.keys() - _validatedAttributes
             if len(additionalAttributes) > 0:
                 if verbose:
                     print('--------')
@@ -2901,6 +2796,10 @@ class TargetedDataset(Dataset):
                     print('--------')
                     print('No additional attributes in the object')
 
+            ## Warn all failures at once
+            if len(failuresToWarn) != 0:
+                warnings.warn('\n'.join(failuresToWarn))
+
             ## Log and final Output
             # Basic failure might compromise logging, failure of QC compromises sample meta
             if len(failureListBasic) == 0:
@@ -2920,7 +2819,7 @@ class TargetedDataset(Dataset):
                         MetaText = 'has sample metadata'
                         MetaBool = True
                 # Log
-                self.Attributes['Log'].append([datetime.now(), 'Dataset conforms to basic TargetedDataset (0 errors), %s (%d errors), %s (%d errors), (%i samples and %i features), with %d additional attributes in the object: %s. QC errors: %s, Meta errors: %s' % (QCText, len(failureListQC), MetaText, len(failureListMeta), self.noSamples, self.noFeatures, len(additionalAttributes), list(additionalAttributes), list(failureListQC), list(failureListMeta))])
+                attributes['Log'].append([datetime.now(), 'Dataset conforms to basic TargetedDataset (0 errors), %s (%d errors), %s (%d errors), (%i samples and %i features), with %d additional attributes in the object: %s. QC errors: %s, Meta errors: %s' % (QCText, len(failureListQC), MetaText, len(failureListMeta), self.noSamples, self.noFeatures, len(additionalAttributes), list(additionalAttributes), list(failureListQC), list(failureListMeta))])
                 # print results
                 if verbose:
                     print('--------')
@@ -2945,7 +2844,7 @@ class TargetedDataset(Dataset):
             else:
                 # try logging
                 try:
-                    self.Attributes['Log'].append([datetime.now(), 'Failed basic TargetedDataset validation, with the following %d issues: %s' % (len(failureListBasic), failureListBasic)])
+                    attributes['Log'].append([datetime.now(), 'Failed basic TargetedDataset validation, with the following %d issues: %s' % (len(failureListBasic), failureListBasic)])
                 except (AttributeError, KeyError, TypeError):
                     if verbose:
                         print('--------')
@@ -2963,7 +2862,6 @@ class TargetedDataset(Dataset):
                     warnings.warn('Does not have QC parameters')
                     warnings.warn('Does not have sample metadata information')
                 return ({'Dataset': True, 'BasicTargetedDataset': False, 'QC': False, 'sampleMetadata': False})
-
         # If it's not a Dataset, no point checking anything more
         else:
             # try logging
@@ -3139,12 +3037,12 @@ class TargetedDataset(Dataset):
 
         # Feature Exclusions
         if filterFeatures:
-            quantTypeMask = self.featureMetadata['quantificationType'].isin(quantificationTypes)
-            calibMethodMask = self.featureMetadata['calibrationMethod'].isin(calibrationMethods)
+            # combine in place into the freshly allocated isin() result
+            featureMask = self.featureMetadata['quantificationType'].isin(quantificationTypes).values
+            numpy.logical_and(featureMask, self.featureMetadata['calibrationMethod'].isin(calibrationMethods).values, out=featureMask)
+            numpy.logical_and(featureMask, self.featureMask, out=featureMask)
 
-            featureMask = numpy.logical_and(quantTypeMask, calibMethodMask).values
-
-            self.featureMask = numpy.logical_and(featureMask, self.featureMask)
+            self.featureMask = featureMask
             if rsdThreshold is not None:
                 self.featureMask &= self.rsdSP <= rsdThreshold
 
@@ -3152,12 +3050,11 @@ class TargetedDataset(Dataset):
 
         # Sample Exclusions
         if filterSamples:
-            sampleMask = self.sampleMetadata['SampleType'].isin(sampleTypes)
-            assayMask = self.sampleMetadata['AssayRole'].isin(assayRoles)
-
-            sampleMask = numpy.logical_and(sampleMask, assayMask).values
+            sampleMask = self.sampleMetadata['SampleType'].isin(sampleTypes).values
+            numpy.logical_and(sampleMask, self.sampleMetadata['AssayRole'].isin(assayRoles).values, out=sampleMask)
+            numpy.logical_and(sampleMask, self.sampleMask, out=sampleMask)
 
-            self.sampleMask = numpy.logical_and(sampleMask, self.sampleMask)
+            self.sampleMask = sampleMask
 
         self.Attributes['Log'].append([datetime.now(), 'Dataset filtered with: filterSamples=%s, filterFeatures=%s, sampleTypes=%s, assayRoles=%s, quantificationTypes=%s, calibrationMethods=%s' % (filterSamples, filterFeatures, sampleTypes, assayRoles, quantificationTypes, calibrationMethods)])
 
@@ -3202,7 +3099,6 @@ class TargetedDataset(Dataset):
 
         # Detect if requires NMR specific alterations
         if 'expno' in self.sampleMetadata.columns:
-            from . import NMRDataset
             NMRDataset._matchDatasetToLIMS(self,pathToLIMSfile)
         else:
             super()._matchDatasetToLIMS(pathToLIMSfile)
@@ -3457,6 +3353,107 @@ class TargetedDataset(Dataset):
         return {'Accuracy': accuracy, 'Precision': precision}
 
 
+# Type expected for the first value of each sampleMetadata column checked by TargetedDataset.validateObject:
+# (column, accepted type(s), description used in messages, failure list the check belongs to)
+_sampleMetadataSchema = (
+    ('Sample File Name', str, 'is str', 'Basic'),
+    ('AssayRole', AssayRole, 'is an enum \'AssayRole\'', 'QC'),
+    ('SampleType', SampleType, 'is an enum \'SampleType\'', 'QC'),
+    ('Dilution', (int, float, numpy.integer, numpy.floating), 'is int or float', 'QC'),
+    ('Batch', (int, float, numpy.integer, numpy.floating), 'is int or float', 'QC'),
+    ('Correction Batch', (int, float, numpy.integer, numpy.floating), 'is int or float', 'QC'),
+    ('Run Order', (int, numpy.integer), 'is int', 'QC'),
+    ('Acquired Time', datetime, 'is datetime', 'QC'),
+    ('Sample Base Name', str, 'is str', 'QC'),
+)
+
+# Attributes expected by TargetedDataset.validateObject, any other attribute is listed as additional
+_validatedAttributes = frozenset({'Attributes', 'VariableType', '_Normalisation', '_name', 'fileName', 'filePath',
+                                  '_intensityData', 'sampleMetadata', 'featureMetadata', 'expectedConcentration', 'sampleMask',
+                                  'featureMask', 'calibration', 'sampleMetadataExcluded', 'intensityDataExcluded',
+                                  'featureMetadataExcluded', 'expectedConcentrationExcluded', 'excludedFlag'})
+
+# Attributes merged by TargetedDataset.__add__, any other attribute is stored as a list [self, other]
+_mergedAttributes = _validatedAttributes | {'AnalyticalPlatform'}
+
+# Default returned by getattr in TargetedDataset.validateObject when an attribute does not exist
+_MISSING = object()
+
+# Number of samples written at a time by TargetedDataset._exportUnifiedCSV
+_exportChunkSize = 1000
+
+# Type expected for each Attributes key checked by TargetedDataset.validateObject: (key, accepted type(s), description used in messages)
+_attributesSchema = (
+    ('methodName', str, 'is a str'),
+    ('externalID', list, 'is a list'),
+)
+
+# Type expected for the first value of each featureMetadata column checked by TargetedDataset.validateObject: (column, accepted type(s), description used in messages)
+_featureMetadataSchema = (
+    ('calibrationMethod', CalibrationMethod, 'is an enum \'CalibrationMethod\''),
+    ('quantificationType', QuantificationType, 'is an enum \'QuantificationType\''),
+    ('Unit', str, 'is a str'),
+)
+
+
+def _namesDifference(referenceNames, names):
+    """
+    Pairs of names that differ between two aligned lists, as reported in :py:meth:`TargetedDataset.validateObject` failure messages.
+
+    :param list referenceNames: reference names (e.g. ``featureMetadata['Feature Name']``)
+    :param list names: names to compare (e.g. ``expectedConcentration.columns``)
+    :return: list of [reference name, name] that differ
+    :rtype: list
+    """
+    namesDiff = pandas.DataFrame({'FeatName': referenceNames, 'ColName': names})
+    return namesDiff.loc[(namesDiff['FeatName'] != namesDiff['ColName']), ['FeatName', 'ColName']].values.tolist()
+
+
+def _columnValueType(column):
+    """
+    Type of the values held in *column*.
+
+    Numeric and boolean columns store a single scalar type, read from the dtype without accessing any value. Categorical columns are typed on their categories, also without accessing any value. Other columns (object, datetime) are typed on their first value.
+
+    :param pandas.Series column: column to inspect
+    :return: type of the column values
+    :rtype: type
+    """
+    if column.dtype.kind in 'biuf':
+        return column.dtype.type
+    if isinstance(column.dtype, pandas.CategoricalDtype) and len(column.dtype.categories) != 0:
+        return type(column.dtype.categories[0])
+    return type(column.iat[0])
+
+
+@functools.lru_cache(maxsize=8)
+def _pdataPattern(pdata):
+    """
+    Compiled regex matching the Bruker `pdata` folder *pdata* in a file path, cached across imports.
+
+    :param int pdata: pdata folder number
+    :return: compiled pattern, to use with ``search``
+    :rtype: re.Pattern
+    """
+    return re.compile('pdata.*?%i' % (pdata))
+
+
+def _escapeDelimiters(dataFrame):
+    """
+    Replace commas by semicolons in the string columns of *dataFrame*, in place.
+
+    Only object columns can hold strings; numeric and datetime64 columns are not examined.
+
+    :param pandas.DataFrame dataFrame: metadata table to escape
+    """
+    for column in dataFrame.select_dtypes(include='object').columns:
+        try:
+            dataFrame[column] = dataFrame[column].str.replace(',', ';', regex=False)
+        except AttributeError:
+            # object column without strings (e.g. datetime objects)
+            pass
+
+
 def main():
     pass
 
@@ -1,41 +1,38 @@
 import warnings
 import numpy
+import pandas
 from ..utilities.extractParams import *
-from datetime import datetime
 
-def getSampleMetadataFromWatersRawFiles(rawDataPath):
+def getSampleMetadataFromWatersRawFiles(rawDataPath, parallelise=False):
 	"""
 	Get acquisition metadata from Waters RAW files and returns them as a dataframe
 
 	:param str rawDataPath: Path to folder of raw data
+	:param bool parallelise: If ``True``, read the parameter files of several samples concurrently
 	"""
 
 	# Get the paramters as a table
-	instrumentParams = extractParams(rawDataPath, 'Waters .raw')
+	instrumentParams = extractParams(rawDataPath, 'Waters .raw', parallelise=parallelise)
 
 	# Strip any whitespace from 'Sample File Name'
 	instrumentParams['Sample File Name'] = instrumentParams['Sample File Name'].str.strip()
 
-	# Parse acqustion times
-	instrumentParams['Acquired Time'] = numpy.nan
-	for i in range(instrumentParams.shape[0]):
-		try:
-			instrumentParams.loc[i, 'Acquired Time'] = datetime.strptime(str(instrumentParams.loc[i, '$$ Acquired Date:']) + " " + str(instrumentParams.loc[i,'$$ Acquired Time:']), '%d-%b-%Y %H:%M:%S')
-		except ValueError:
-			pass
+	# Parse acquisition times, NaN if unparsable. Kept as an object column of datetime.datetime, the type documented for sampleMetadata['Acquired Time'],
+	# as MSDataset merges this column into an existing sampleMetadata with combine_first
+	acquiredTime = pandas.to_datetime(instrumentParams['$$ Acquired Date:'].astype(str) + " " + instrumentParams['$$ Acquired Time:'].astype(str), format='%d-%b-%Y %H:%M:%S', errors='coerce')
+	instrumentParams['Acquired Time'] = pandas.Series(acquiredTime.dt.to_pydatetime(), index=acquiredTime.index, dtype=object).where(acquiredTime.notnull(), numpy.nan)
 		
 	# Rename '$$ Acquired Time' and '$$ Acquired Date to avoid confusion
-	instrumentParams.rename(columns={'$$ Acquired Time:': 'Measurement Time'}, inplace=True)
-	instrumentParams.rename(columns={'$$ Acquired Date:': 'Measurement Date'}, inplace=True)
+	instrumentParams.rename(columns={'$$ Acquired Time:': 'Measurement Time', '$$ Acquired Date:': 'Measurement Date'}, inplace=True)
 	
 	
 	##
 	# Detect duplicate experiment filenames
 	##
-	duplicateSamples = instrumentParams.loc[instrumentParams['Sample File Name'].duplicated(keep=False)]
-	if duplicateSamples.size > 0:
-		warnings.warn('Duplicate raw data loaded, discarding duplicates.', UserWarning)
+	duplicateSamples = instrumentParams['Sample File Name'].duplicated(keep='first')
+	if duplicateSamples.any():
+		warnings.warn('Duplicate raw data loaded, discarding %i duplicates of: %s.' % (duplicateSamples.sum(), ', '.join(instrumentParams.loc[duplicateSamples, 'Sample File Name'].unique())), UserWarning)
 		# Drop duplicate files
-		instrumentParams = instrumentParams.loc[instrumentParams['Sample File Name'].duplicated(keep='first')==False]
+		instrumentParams = instrumentParams.loc[~duplicateSamples]
 
 	return instrumentParams
@@ -4,8 +4,9 @@ import re
 import numpy
 import copy
 import warnings
+import multiprocessing
 
-def importBrukerXML(filelist):
+def importBrukerXML(filelist, parallelise=False):
 	"""
 	Load Bruker quantification data from the xml files listed in *fileList*, and return as data matrices.
 
@@ -14,6 +15,7 @@ def importBrukerXML(filelist):
 	TODO: Reconcile LODS, LOQS, and ranges while importing
 
 	:param list filelist: List of paths to load data from
+	:param bool parallelise: If ``True``, parse the xml files on multiple cores
 	:return: intensityData, sampleMetadata, and featureMetadata
 	:rtype: tuple of (intensityData, sampleMetadata, featureMetadata)
 	"""
@@ -29,30 +31,43 @@ def importBrukerXML(filelist):
 
 	nameParser = re.compile(r'^(.+?)_expno(\d+)\..+?$')
 
-	for filename in filelist:
-		try:
-			sampleName, processingDate, quantList = readBrukerXML(filename)
+	if not isinstance(parallelise, bool):
+		raise TypeError('parallelise must be True or False')
 
-			df = pandas.DataFrame.from_dict(quantList)
+	if parallelise and (len(filelist) > 1):
+		# Parse the files on multiple cores, results are gathered in the order of filelist
+		# Use one fewer worker than there are CPU cores
+		cores = max(multiprocessing.cpu_count() - 1, 1)
+		with multiprocessing.Pool(processes=cores) as pool:
+			parsedFiles = pool.map(_readBrukerXMLOrNone, filelist)
+	else:
+		parsedFiles = map(_readBrukerXMLOrNone, filelist)
 
-			if intensityData is None:
-				intensityData = numpy.zeros((len(filelist), len(quantList)))
-				featureMetadata = copy.deepcopy(df)
-				featureMetadata.drop('value', inplace=True, axis=1)
+	for filename, parsed in zip(filelist, parsedFiles):
+		if parsed is None:
+			warnings.warn('Error parsing xml in %s, skipping' % filename)
 
-			baseName = nameParser.match(sampleName).groups()
+			importPass[sampleMetadata.loc[sampleMetadata['Path'] == filename].index.values] = False
+			continue
 
-			sampleMetadata.loc[sampleMetadata['Path'] == filename, 'Sample Base Name'] = baseName[0] + '/' + baseName[1]
-			#sampleMetadata.loc[sampleMetadata['Path'] == filename, 'Sample File Name'] = sampleName  # Sample File Name should match Base Name, instead of the Sample File Name hardcoded in the XML file
-			sampleMetadata.loc[sampleMetadata['Path'] == filename, 'Sample File Name'] = baseName[0] + '/' + baseName[1]
-			sampleMetadata.loc[sampleMetadata['Path'] == filename, 'expno'] = baseName[1]
-			sampleMetadata.loc[sampleMetadata['Path'] == filename, 'Acquired Time'] = processingDate
+		sampleName, processingDate, quantList = parsed
 
-			intensityData[sampleMetadata.loc[sampleMetadata['Path'] == filename].index.values, :] = df['value']
-		except ElementTree.ParseError:
-			warnings.warn('Error parsing xml in %s, skipping' % filename)
+		df = pandas.DataFrame.from_dict(quantList)
 
-			importPass[sampleMetadata.loc[sampleMetadata['Path'] == filename].index.values] = False
+		if intensityData is None:
+			intensityData = numpy.zeros((len(filelist), len(quantList)))
+			featureMetadata = copy.deepcopy(df)
+			featureMetadata.drop('value', inplace=True, axis=1)
+
+		baseName = nameParser.match(sampleName).groups()
+
+		sampleMetadata.loc[sampleMetadata['Path'] == filename, 'Sample Base Name'] = baseName[0] + '/' + baseName[1]
+		#sampleMetadata.loc[sampleMetadata['Path'] == filename, 'Sample File Name'] = sampleName  # Sample File Name should match Base Name, instead of the Sample File Name hardcoded in the XML file
+		sampleMetadata.loc[sampleMetadata['Path'] == filename, 'Sample File Name'] = baseName[0] + '/' + baseName[1]
+		sampleMetadata.loc[sampleMetadata['Path'] == filename, 'expno'] = baseName[1]
+		sampleMetadata.loc[sampleMetadata['Path'] == filename, 'Acquired Time'] = processingDate
+
+		intensityData[sampleMetadata.loc[sampleMetadata['Path'] == filename].index.values, :] = df['value']
 
 	runOrder = sampleMetadata.sort_values(by='Acquired Time').index.values
 	sampleMetadata['Run Order'] = numpy.argsort(runOrder)
@@ -71,6 +86,16 @@ def importBrukerXML(filelist):
 	return (intensityData, sampleMetadata, featureMetadata)
 
 
+def _readBrukerXMLOrNone(path):
+	"""
+	Call :py:func:`readBrukerXML` on *path*, returning ``None`` if the xml cannot be parsed (the warning is raised by the caller, in the main process).
+	"""
+	try:
+		return readBrukerXML(path)
+	except ElementTree.ParseError:
+		return None
+
+
 def readBrukerXML(path):
 	"""
 	Extract Bruker quatification data from the XML file at *path* and return as a dict, with one element for each value.
@@ -8,11 +8,12 @@ import re
 import logging
 import os
 import codecs
+import functools
+import collections
 import pandas
 import warnings
-from ._conditionalJoin import *
 
-def extractParams(filepath, filetype, pdata=1):
+def extractParams(filepath, filetype, pdata=1, parallelise=False):
 	"""
 	Extract analytical parameters from raw data files for Bruker and Waters .RAW data only.
 
@@ -21,10 +22,14 @@ def extractParams(filepath, filetype, pdata=1):
 	:param filetype: Search for this type of data
 	:type filetype: string
 	:param int pdata: pdata folder for Bruker data
+	:param bool parallelise: If ``True``, read the parameter files of several samples concurrently
 	:return: Analytical parameters, indexed by file name.
 	:rtype: pandas.Dataframe
 	"""
 
+	if not isinstance(parallelise, bool):
+		raise TypeError('parallelise must be True or False')
+
 	queryItems = dict()
 	# Build our ID cirteria
 	if filetype == 'Bruker':
@@ -42,6 +47,8 @@ def extractParams(filepath, filetype, pdata=1):
 		query = r'^\$\$\W(.+?)\W+([\w-]+@[\w-]+)$'
 		acqTimeRE = re.compile(query)
 
+		extract = functools.partial(_extractBrukerparams, queryItems=queryItems, acqTimeRE=acqTimeRE, raiseWarning=False)
+
 	elif filetype == 'Waters .raw':
 		pattern = '.+?\.raw$'
 		queryItems['_extern.inf'] = ['Resolution', 'Capillary (kV)','Sampling Cone', u'Source Temperature (°C)',
@@ -55,13 +62,36 @@ def extractParams(filepath, filetype, pdata=1):
 		pattern = re.compile(pattern)
 		fileList = buildFileList(filepath, pattern)
 
-	# iterate over the list
-	results = list()
-	for filename in fileList:
-		if filetype == 'Bruker':
-			results.append(extractBrukerparams(filename, queryItems, acqTimeRE))
-		elif filetype == 'Waters .raw':
-			results.append(extractWatersRAWParams(filename, queryItems))
+		extract = functools.partial(_extractWatersRAWParams, queryItems=queryItems, raiseWarning=False)
+
+	# Read data found through several paths (symlinked folders) once, keep the first path found
+	fileList, allFiles, seen = [], fileList, set()
+	for file in allFiles:
+		resolved = os.path.join(os.path.realpath(os.path.dirname(file)), os.path.basename(file))
+		if resolved not in seen:
+			seen.add(resolved)
+			fileList.append(file)
+	if len(fileList) < len(allFiles):
+		warnings.warn('%i data files found through more than one path, only read once.' % (len(allFiles) - len(fileList)))
+
+	# iterate over the list, each file gives its parameters and the names of the parameters not found
+	if parallelise and (len(fileList) > 1):
+		# Reading is I/O bound, use threads, results are gathered in the order of fileList
+		from multiprocessing.pool import ThreadPool
+
+		with ThreadPool() as pool:
+			extracted = pool.map(extract, fileList)
+	else:
+		extracted = list(map(extract, fileList))
+	results = [result for result, missingParameters in extracted]
+
+	# Warn once for the whole batch rather than per parameter and file, listing the files missing each set of parameters
+	filesByMissing = collections.OrderedDict()
+	for result, missingParameters in extracted:
+		if missingParameters:
+			filesByMissing.setdefault(', '.join(missingParameters), []).append(result['Sample File Name'])
+	if filesByMissing:
+		warnings.warn('Parameters not found in %i of %i files: %s.' % (sum(len(files) for files in filesByMissing.values()), len(results), '; '.join('%s in %s' % (missingParameters, ', '.join(files)) for missingParameters, files in filesByMissing.items())))
 
 	resultsDF = pandas.DataFrame(results)
 	resultsDF = resultsDF.apply(lambda x: pandas.to_numeric(x, errors='ignore'))
@@ -103,6 +133,42 @@ def buildFileList(filepath, pattern):
 	return fileList
 
 
+def _scanBrukerFiles(filepath, pattern, pdataPattern, visited=None):
+	"""
+	Yield the paths under *filepath* whose name matches *pattern* and whose full path matches *pdataPattern*.
+
+	Follows the traversal of :py:func:`buildFileList` (directory listing order, depth first, matching items are not descended into) but uses :py:func:`os.scandir` to avoid a stat call per entry, and applies the pdata filter while walking.
+	Symbolic links to directories are followed, but each directory is scanned once, so a link to a parent directory does not recurse forever.
+
+	:param str filepath: Look for data in all the directories under this location
+	:param re.Pattern pattern: compiled regex matched against each item name
+	:param re.Pattern pdataPattern: compiled regex searched in the full path of each matched item
+	:param visited: real paths of the directories already scanned, used when descending
+	:type visited: set or None
+	:return: generator of matching paths
+	"""
+	if visited is None:
+		visited = set()
+	realPath = os.path.realpath(filepath)
+	if realPath in visited:
+		logging.debug('Already scanned: ' + filepath)
+		return
+	visited.add(realPath)
+
+	with os.scandir(filepath) as entries:
+		entries = list(entries)
+	for entry in entries:
+		if pattern.match(entry.name):
+			if pdataPattern.search(entry.path):
+				yield entry.path
+		elif entry.is_dir():
+			yield from _scanBrukerFiles(entry.path, pattern, pdataPattern, visited)
+
+
+# Value following a parameter name in Waters parameter files, matched from the end of the name
+_watersValueRE = re.compile(r'\W+(.+)\r')
+
+
 def extractWatersRAWParams(filePath, queryItems):
 	"""
 	Read parameters defined in *queryItems* for Waters .RAW data.
@@ -114,10 +180,25 @@ def extractWatersRAWParams(filePath, queryItems):
 	:rtype: dict
 	"""
 
+	return _extractWatersRAWParams(filePath, queryItems)[0]
+
+
+def _extractWatersRAWParams(filePath, queryItems, raiseWarning=True):
+	"""
+	Read parameters defined in *queryItems* for Waters .RAW data, see :py:func:`extractWatersRAWParams`.
+
+	:param bool raiseWarning: If ``True`` warn for each missing parameter or file, messages are always recorded in 'Warnings'
+	:returns: Dictionary of extracted parameters, and names of the parameters not found (all those of a file that could not be read)
+	:rtype: tuple(dict, list)
+	"""
+
 	# Get filename
 	filename = os.path.basename(filePath)
 	results = dict()
 	results['Warnings'] = ''
+	# collect messages and join once on return
+	warningList = []
+	missingParameters = []
 
 	results['File Path'] = filePath
 	results['Sample File Name'] = filename[:-4]
@@ -125,36 +206,41 @@ def extractWatersRAWParams(filePath, queryItems):
 	for inputFile in queryItems.keys():
 		localPath = os.path.join(filePath, inputFile)
 		try:
-			f = codecs.open(localPath, 'r', encoding='latin-1')
-			contents = f.readlines()
+			# read in one go and close, keep line endings untranslated ('\r' is matched by the value regex) and split them as codecs readlines()
+			with open(localPath, 'r', encoding='latin-1', newline='') as f:
+				contents = f.read().splitlines(True)
 		
 			logging.debug('Searching file: ' + localPath)
 
 			# Loop over the search terms
 			for findthis in queryItems[inputFile]:
 				logging.debug('Looking for: ' + findthis)
-				indices = [i for i, s in enumerate(contents) if findthis in s]
-				if indices:
-					logging.debug('Found on line: ' + str(indices[0]))
-					foundLine = contents[indices[0]]
+				# first line holding the parameter name (stop scanning there)
+				index = next((i for i, s in enumerate(contents) if findthis in s), None)
+				if index is not None:
+					logging.debug('Found on line: ' + str(index))
+					foundLine = contents[index]
 					logging.debug('Line reads: ' + foundLine.rstrip())
-					query = '(' + re.escape(findthis) + ')\W+(.+)\r'
-					logging.debug('Regex is: ' + query)
-					m = re.search(query, foundLine)
-					logging.debug('Found this: ' + m.group(1) + ' and: ' + m.group(2))
+					m = _watersValueRE.match(foundLine, foundLine.find(findthis) + len(findthis))
+					logging.debug('Found this: ' + findthis + ' and: ' + m.group(1))
 			
-					results[findthis.strip()] = m.group(2).strip()
+					results[findthis.strip()] = m.group(1).strip()
 				else:
-					results['Warnings'] = conditionalJoin(results['Warnings'] , 'Parameter ' + findthis.strip() + ' not found.')
-					warnings.warn('Parameter ' + findthis + ' not found in file: ' + os.path.join(localPath))
-			
-			f.close()
+					warningList.append('Parameter ' + findthis.strip() + ' not found.')
+					missingParameters.append(findthis.strip())
+					if raiseWarning:
+						warnings.warn('Parameter ' + findthis + ' not found in file: ' + os.path.join(localPath))
+
 		except IOError:
-			for findthis in queryItems[inputFile]:
-				results['Warnings'] = conditionalJoin(results['Warnings'], 'Unable to open ' + localPath + ' for reading.')
+			# opening is the existence check (no separate stat of the folder), report a missing file once for all its parameters
+			warningList.append('Unable to open ' + localPath + ' for reading.')
+			missingParameters.extend(findthis.strip() for findthis in queryItems[inputFile])
+			if raiseWarning:
 				warnings.warn('Unable to open ' + localPath + ' for reading.')
 
-	return results
+	results['Warnings'] = '; '.join(warningList)
+
+	return results, missingParameters
 
 
 
@@ -170,6 +256,18 @@ def extractBrukerparams(path, queryItems, acqTimeRE):
 	:rtype: dict
 	"""
 
+	return _extractBrukerparams(path, queryItems, acqTimeRE)[0]
+
+
+def _extractBrukerparams(path, queryItems, acqTimeRE, raiseWarning=True):
+	"""
+	Read parameters defined in *queryItems* for Bruker data, see :py:func:`extractBrukerparams`.
+
+	:param bool raiseWarning: If ``True`` warn for each missing parameter or file, messages are always recorded in 'Warnings'
+	:returns: Dictionary of extracted parameters, and names of the parameters not found (all those of a file that could not be read)
+	:rtype: tuple(dict, list)
+	"""
+
 	pathComponents = []
 	path2 = path
 	for i in range(5):
@@ -178,6 +276,8 @@ def extractBrukerparams(path, queryItems, acqTimeRE):
 
 	results = dict()
 	results['Warnings'] = ''
+	warningList = []
+	missingParameters = []
 
 	results['File Path'] = path
 	results['Sample File Name'] = pathComponents[4] + '/' + pathComponents[3]
@@ -206,13 +306,19 @@ def extractBrukerparams(path, queryItems, acqTimeRE):
 					results[findthis] = foundLine
 				else:
 					results[findthis] = ''
-					results['Warnings'] = conditionalJoin(results['Warnings'], 'Parameter ' + findthis.strip() + ' not found.')
-					warnings.warn('Parameter ' + findthis + ' not found in file: ' + os.path.join(localPath))
+					warningList.append('Parameter ' + findthis.strip() + ' not found.')
+					missingParameters.append(findthis.strip())
+					if raiseWarning:
+						warnings.warn('Parameter ' + findthis + ' not found in file: ' + os.path.join(localPath))
 
 			f.close()
 		except IOError:
-			results['Warnings'] = conditionalJoin(results['Warnings'], 'Unable to open ' + localPath + ' for reading.')
-			warnings.warn('Unable to open ' + localPath + ' for reading.')
+			warningList.append('Unable to open ' + localPath + ' for reading.')
+			missingParameters.extend(findthis.strip() for findthis in queryItems[inputFile])
+			if raiseWarning:
+				warnings.warn('Unable to open ' + localPath + ' for reading.')
+
+	results['Warnings'] = '; '.join(warningList)
 
 	##
 	# Process parameters
@@ -246,7 +352,7 @@ def extractBrukerparams(path, queryItems, acqTimeRE):
 			else:
 				cleanedresults[key] = results[key]
 
-	return cleanedresults
+	return cleanedresults, missingParameters
 
 
 def main():